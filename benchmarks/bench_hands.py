@@ -0,0 +1,80 @@
+"""Microbenchmark for ClockRenderer.draw_analog_clock.
+
+Counts the Qt paint objects constructed per frame and the time per frame,
+once with the hand cache cleared before every frame (the old behaviour)
+and once with it warm.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_hands.py
+"""
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QGuiApplication, QImage, QPainter, QPen, QBrush, \
+    QPainterPath
+
+from clock import render
+from clock.render import ClockRenderer
+
+FRAMES = 2000
+RADIUS_MAP = {"sec": 390, "min": 340, "hour": 240, "digit": 460}
+
+
+def counting(cls, counter):
+    """Subclass ``cls`` so that every construction bumps ``counter``."""
+
+    class Counted(cls):
+        def __init__(self, *args):
+            counter[0] += 1
+            super().__init__(*args)
+
+    Counted.__name__ = cls.__name__
+    return Counted
+
+
+def run(renderer, image, cold):
+    """Return (allocations per frame, microseconds per frame)."""
+    counter = [0]
+    originals = (render.QPen, render.QBrush, render.QPainterPath)
+    render.QPen = counting(QPen, counter)
+    render.QBrush = counting(QBrush, counter)
+    render.QPainterPath = counting(QPainterPath, counter)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    local_time = datetime(2024, 1, 1, 10, 8, 30)
+    try:
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            if cold:
+                renderer.invalidate_hands()
+            renderer.draw_analog_clock(painter, local_time, image.width(),
+                                       image.height(), RADIUS_MAP)
+        elapsed = time.perf_counter() - start
+    finally:
+        painter.end()
+        render.QPen, render.QBrush, render.QPainterPath = originals
+
+    return counter[0] / FRAMES, elapsed / FRAMES * 1e6
+
+
+def main():
+    app = QGuiApplication(sys.argv)
+    image = QImage(1920, 1080, QImage.Format_ARGB32_Premultiplied)
+    renderer = ClockRenderer()
+
+    for label, cold in (("uncached", True), ("cached", False)):
+        allocations, micros = run(renderer, image, cold)
+        print(f"{label:>9}: {allocations:5.1f} paint objects/frame, "
+              f"{micros:8.1f} us/frame")
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""Headless render benchmarks for ClockRenderer and ClockWindow.
+
+Renders offscreen into QImages and reports median and p95 timings as JSON:
+
+    python benchmarks/bench_render.py --output results.json
+    python benchmarks/bench_render.py --compare baseline.json
+
+Compare mode exits with status 1 when any benchmark's median is slower
+than the baseline by more than ``--threshold``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytz
+from PyQt5.QtCore import QPoint
+from PyQt5.QtGui import QImage, QPainter, QPixmap, QRegion
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from clock.config import ClockConfig
+from clock.loader import loader_pool
+from clock.render import ClockRenderer
+from clock.timesource import FakeTimeSource
+from clock.utils import get_local_time
+from clock.zones import zone_engine
+
+SIZES = [(800, 600), (1920, 1080), (3840, 2160)]
+LOCAL_TIME = datetime(2024, 1, 1, 10, 8, 30)
+
+STARTUP_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+app = QApplication([])
+from clock.config import ClockConfig
+ClockConfig.SNAPSHOT_ENABLED = bool(sys.argv[1])
+ClockConfig.SNAPSHOT_PATH = sys.argv[1] or None
+from clock.ui.window import ClockWindow
+window = ClockWindow()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+window.close()
+"""
+
+
+def measure(function, min_time, min_runs=5):
+    """Run ``function`` repeatedly and return per-call timings in us."""
+    samples = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < min_runs or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def summarize(samples):
+    """Median, p95 and run count of a list of timings."""
+    ordered = sorted(samples)
+    return {
+        "median_us": round(statistics.median(ordered), 2),
+        "p95_us": round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+        "runs": len(ordered),
+    }
+
+
+def bench_renderer(results, sizes, min_time):
+    """Time the ClockRenderer drawing calls on their own."""
+    renderer = ClockRenderer()
+
+    for width, height in sizes:
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        radius = height / 2 - 50
+        radius_map = {"sec": radius - 100, "min": radius - 150,
+                      "hour": radius - 250, "digit": radius - 30}
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        results[f"draw_analog_clock/{width}x{height}"] = summarize(measure(
+            lambda: renderer.draw_analog_clock(painter, LOCAL_TIME, width,
+                                               height, radius_map),
+            min_time))
+
+        for name, path in ClockConfig.DIGITAL_STYLES.items():
+            style = QPixmap(path)
+            results[f"draw_digital_clock/{name}/{width}x{height}"] = \
+                summarize(measure(
+                    lambda: renderer.draw_digital_clock(
+                        painter, LOCAL_TIME, width, height, style),
+                    min_time))
+        painter.end()
+
+
+def bench_paint_event(results, sizes, min_time):
+    """Time full ClockWindow.paintEvent renders, warm and cold."""
+    from clock.ui.window import ClockWindow
+
+    window = ClockWindow(snapshot=False)
+    styles = [(False, name, path)
+              for name, path in ClockConfig.ANALOG_STYLES.items()]
+    styles += [(True, name, path)
+               for name, path in ClockConfig.DIGITAL_STYLES.items()]
+
+    for width, height in sizes:
+        window.resize(width, height)
+        loader_pool().waitForDone()
+        QApplication.processEvents()
+
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+
+        def paint():
+            window.render(image, QPoint(), QRegion(),
+                          QWidget.DrawWindowBackground)
+
+        def paint_cold():
+            window.face_layer_key = None
+            paint()
+
+        for digital, name, path in styles:
+            window.is_digital = digital
+            window.current_style_path = path
+            paint()
+
+            label = "digital" if digital else "analog"
+            key = f"paintEvent/{label}/{name}/{width}x{height}"
+            results[key] = summarize(measure(paint, min_time))
+            results[key + "/cold"] = summarize(measure(paint_cold, min_time))
+
+
+def bench_tick(results, sizes, min_time):
+    """Time one second tick through the real repaint path, per backend.
+
+    Each call advances the displayed time by a second and processes the
+    resulting paint events of a shown window, so the painter backend's
+    dirty rectangle and the scene backend's item-level updates are
+    compared like for like.
+    """
+    from datetime import timedelta
+
+    from clock.ui.window import ClockWindow
+
+    for backend in ("painter", "scene"):
+        window = ClockWindow(backend=backend, snapshot=False)
+        window.scheduler.stop()
+        window.show()
+
+        for width, height in sizes:
+            window.resize(width, height)
+            loader_pool().waitForDone()
+            QApplication.processEvents()
+
+            for digital in (False, True):
+                if window.is_digital != digital:
+                    window.toggle_clock_mode()
+                window.local_time = LOCAL_TIME
+                QApplication.processEvents()
+
+                def tick():
+                    window.local_time += timedelta(seconds=1)
+                    if window.scene_view is not None:
+                        window.scene_view.set_time(window.local_time)
+                    else:
+                        window.update(window.clock_rect())
+                    QApplication.processEvents()
+
+                label = "digital" if digital else "analog"
+                results[f"tick/{backend}/{label}/{width}x{height}"] = \
+                    summarize(measure(tick, min_time))
+        window.close()
+
+
+def bench_local_time(results, min_time):
+    """Time get_local_time for every configured zone."""
+    for city, tz_name in ClockConfig.TIME_ZONES.items():
+        results[f"get_local_time/{tz_name}"] = summarize(
+            measure(lambda: get_local_time(tz_name), min_time, 1000))
+
+
+def bench_dst_replay(results, min_time):
+    """Time second-by-second reads across DST changes, 1000x per call.
+
+    A frozen fake clock is stepped one second at a time through the hour
+    around each configured zone's next transition, so the zone cache has
+    to roll over exactly as it would on the day.
+    """
+    real_source = zone_engine.source
+    try:
+        for city, tz_name in ClockConfig.TIME_ZONES.items():
+            # Look up the transition from now, not the last zone's replay
+            zone_engine.source = real_source
+            moment = zone_engine.next_transition(tz_name)
+            if moment is None:
+                continue
+            source = zone_engine.source = FakeTimeSource(moment - 500, rate=0)
+
+            def replay():
+                for _ in range(1000):
+                    source.advance(1)
+                    get_local_time(tz_name)
+                source.advance(-1000)
+
+            results[f"dst_replay/{tz_name}"] = summarize(
+                measure(replay, min_time))
+    finally:
+        zone_engine.source = real_source
+
+
+def bench_planner(results, min_time):
+    """Time batch offset lookups: 50 zones over a year of 15-minute slots."""
+    from clock import planner
+
+    zones = sorted(set(ClockConfig.TIME_ZONES.values()) |
+                   set(pytz.common_timezones[::10]))[:50]
+    start = int(time.time())
+    instants = planner.time_grid(start, start + 365 * 86400, 900)
+    results[f"planner/{len(zones)}x{instants.size}"] = summarize(
+        measure(lambda: planner.common_slots(instants, zones), min_time))
+
+
+def bench_alarms(results, min_time):
+    """Time adding an alarm to, and firing one from, 10000 scheduled."""
+    from clock.alarms import AlarmScheduler
+
+    with tempfile.TemporaryDirectory() as directory:
+        alarms = AlarmScheduler(os.path.join(directory, "alarms.json"))
+        zones = list(ClockConfig.TIME_ZONES.values())
+        for index in range(10000):
+            alarms.add("Bench", zones[index % len(zones)], index % 24,
+                       index % 60, range(7))
+
+        results["alarms/add/10000"] = summarize(measure(
+            lambda: alarms.add("Bench", "Asia/Tokyo", 9, 0, range(5)),
+            min_time))
+
+        # Make the earliest alarm due, as when its timer fires
+        real_source = zone_engine.source
+        try:
+            def fire():
+                zone_engine.source = FakeTimeSource(alarms.heap[0][0], rate=0)
+                alarms._on_timeout()
+
+            results["alarms/fire/10000"] = summarize(measure(fire, min_time))
+        finally:
+            zone_engine.source = real_source
+        alarms.save_timer.stop()
+
+
+def bench_startup(results, runs):
+    """Time ClockWindow construction plus first paint in a fresh process.
+
+    Measured without a last-frame snapshot and with one written by a
+    priming run.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, "last-frame.bin")
+        for name, argument in (("startup/ClockWindow", ""),
+                               ("startup/ClockWindow/snapshot", snapshot)):
+            samples = []
+            for run in range(runs + bool(argument)):
+                output = subprocess.run(
+                    [sys.executable, "-c", STARTUP_SCRIPT, argument],
+                    cwd=ROOT, capture_output=True, text=True, check=True
+                ).stdout.strip().splitlines()
+                # The priming run only writes the snapshot
+                if not argument or run:
+                    samples.append(float(output[-1]) * 1e6)
+            results[name] = summarize(samples)
+
+
+def compare(results, baseline, threshold):
+    """Return (name, baseline, current, ratio) for every slowdown."""
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if not previous or not previous["median_us"]:
+            continue
+        ratio = current["median_us"] / previous["median_us"]
+        if ratio > 1 + threshold:
+            regressions.append((name, previous["median_us"],
+                                current["median_us"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="flag slowdowns against a stored results file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed median slowdown, default 0.10 (10%%)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds to spend per benchmark")
+    parser.add_argument("--quick", action="store_true",
+                        help="only the smallest window size")
+    parser.add_argument("--startup-runs", type=int, default=3)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    # Shown windows would otherwise start the ticking sound
+    ClockConfig.SOUND_ENABLED = False
+    sizes = SIZES[:1] if args.quick else SIZES
+
+    results = {}
+    bench_local_time(results, args.min_time)
+    bench_dst_replay(results, args.min_time)
+    bench_planner(results, args.min_time)
+    bench_alarms(results, args.min_time)
+    bench_renderer(results, sizes, args.min_time)
+    bench_paint_event(results, sizes, args.min_time)
+    bench_tick(results, sizes, args.min_time)
+    if args.startup_runs:
+        bench_startup(results, args.startup_runs)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qpa": os.environ["QT_QPA_PLATFORM"],
+            "created": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text)
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"SLOWER {name}: {before:.1f} -> {after:.1f} us "
+                  f"({(ratio - 1) * 100:+.0f}%)", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+    del app
+
+
+if __name__ == "__main__":
+    main()
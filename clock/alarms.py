@@ -0,0 +1,292 @@
+import heapq
+import json
+import os
+import re
+import tempfile
+
+from PyQt5.QtCore import Qt, QObject, QStandardPaths, QTimer, pyqtSignal
+
+from clock.config import ClockConfig
+from clock.zones import zone_engine
+
+DAY = 86400
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+DAY_SETS = {"daily": range(7), "weekdays": range(5), "weekends": (5, 6)}
+
+
+def default_alarms_path():
+    """File the alarms are kept in, in the per-user data directory."""
+    if ClockConfig.ALARMS_PATH:
+        return ClockConfig.ALARMS_PATH
+    base = QStandardPaths.writableLocation(
+        QStandardPaths.GenericDataLocation) or tempfile.gettempdir()
+    return os.path.join(base, "global-clock", "alarms.json")
+
+
+def parse_days(text):
+    """Weekday numbers, Monday being 0, from e.g. "Mon-Fri,Sun"."""
+    text = text.strip().lower()
+    if not text or text == "once":
+        return ()
+    if text in DAY_SETS:
+        return tuple(DAY_SETS[text])
+
+    days = set()
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        try:
+            start = DAY_NAMES.index(first.strip()[:3])
+            end = DAY_NAMES.index(last.strip()[:3]) if last else start
+        except ValueError:
+            raise ValueError(f"unknown day in {part.strip()!r}") from None
+        days.update(day % 7 for day in range(start, start + (end - start) % 7
+                                              + 1))
+    return tuple(sorted(days))
+
+
+def parse_alarm(text):
+    """Return (hour, minute, weekdays) for e.g. "09:00 Mon-Fri"."""
+    match = re.fullmatch(r"\s*(\d{1,2}):(\d{2})\s*(.*)", text)
+    if not match:
+        raise ValueError("expected HH:MM followed by optional days")
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        raise ValueError(f"{hour:02d}:{minute:02d} is not a time of day")
+    return hour, minute, parse_days(match.group(3))
+
+
+def wall_to_utc(table, wall):
+    """UTC epoch seconds at which a zone's clock shows ``wall``.
+
+    ``wall`` is the local time as if it were UTC epoch seconds. When
+    clocks go back the first of the two moments is used; when they go
+    forward past ``wall`` it fires as late as the gap is long, so an
+    alarm at 02:30 rings at 03:30 on the night that hour is skipped.
+    """
+    before = table.offsets[table.index_at(wall - DAY)]
+    after = table.offsets[table.index_at(wall + DAY)]
+    moments = [wall - offset for offset in {before, after}
+               if table.offsets[table.index_at(wall - offset)] == offset]
+    return min(moments) if moments else wall - before
+
+
+class Alarm:
+    """A wall-clock time in a city, once or on some days of the week."""
+
+    def __init__(self, alarm_id, city, tz_name, hour, minute, weekdays=(),
+                 label="", enabled=True):
+        self.id = alarm_id
+        self.city = city
+        self.tz_name = tz_name
+        self.hour = hour
+        self.minute = minute
+        self.weekdays = tuple(weekdays)
+        self.label = label
+        self.enabled = enabled
+
+        # UTC epoch seconds of the next firing, None while not scheduled
+        self.next_fire = None
+
+    def next_occurrence(self, after):
+        """UTC epoch seconds of the first firing after ``after``."""
+        table = zone_engine.table(self.tz_name)
+        offset = table.offsets[table.index_at(after)]
+        day = int(after + offset) // DAY
+        wall = self.hour * 3600 + self.minute * 60
+
+        for date in range(day, day + 8):
+            # 1970-01-01 was a Thursday
+            if self.weekdays and (date + 3) % 7 not in self.weekdays:
+                continue
+            moment = wall_to_utc(table, date * DAY + wall)
+            if moment > after:
+                return moment
+        return None
+
+    def describe(self):
+        """Readable summary such as "09:00 Tokyo, Mon Tue Wed"."""
+        days = " ".join(DAY_NAMES[day].title() for day in self.weekdays)
+        text = f"{self.hour:02d}:{self.minute:02d} {self.city}, " \
+               f"{days or 'once'}"
+        return f"{text} — {self.label}" if self.label else text
+
+    def to_dict(self):
+        return {"id": self.id, "city": self.city, "tz_name": self.tz_name,
+                "hour": self.hour, "minute": self.minute,
+                "weekdays": list(self.weekdays), "label": self.label,
+                "enabled": self.enabled}
+
+
+class AlarmScheduler(QObject):
+    """Alarms in a min-heap keyed on their next UTC firing time.
+
+    One single-shot timer is armed for the earliest entry. Adding an
+    alarm pushes one entry and firing pops one and pushes that alarm's
+    next occurrence, both O(log n); removed or rescheduled alarms leave
+    stale entries that are dropped when they reach the top. Nothing runs
+    per frame. Changes are written to disk once per event-loop pass.
+    """
+
+    fired = pyqtSignal(object)
+    changed = pyqtSignal()
+
+    def __init__(self, path=None, parent=None):
+        super().__init__(parent)
+        self.path = path or default_alarms_path()
+        self.alarms = {}
+        self.heap = []
+        self.next_id = 1
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._on_timeout)
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save)
+
+    def load(self):
+        """Read saved alarms and schedule the enabled ones."""
+        try:
+            with open(self.path) as handle:
+                entries = json.load(handle)
+        except FileNotFoundError:
+            entries = []
+        except (OSError, ValueError) as e:
+            print(f"Error loading alarms: {e}")
+            entries = []
+
+        now = zone_engine.source.now()
+        for entry in entries:
+            try:
+                alarm = Alarm(entry["id"], entry["city"], entry["tz_name"],
+                              entry["hour"], entry["minute"],
+                              entry.get("weekdays", ()),
+                              entry.get("label", ""),
+                              entry.get("enabled", True))
+                if alarm.enabled:
+                    alarm.next_fire = alarm.next_occurrence(now)
+            except (KeyError, TypeError, ValueError) as e:
+                # Unknown zones raise a KeyError subclass
+                print(f"Error loading alarm {entry!r}: {e}")
+                continue
+            self.alarms[alarm.id] = alarm
+            self.next_id = max(self.next_id, alarm.id + 1)
+
+        # One heapify instead of a push per alarm
+        self.heap = [(alarm.next_fire, alarm.id)
+                     for alarm in self.alarms.values()
+                     if alarm.next_fire is not None]
+        heapq.heapify(self.heap)
+        self._arm()
+
+    def save(self):
+        """Write every alarm to disk."""
+        entries = [alarm.to_dict() for alarm in self.alarms.values()]
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so readers never see halves
+            fd, temp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(fd, "w") as handle:
+                json.dump(entries, handle)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Error saving alarms: {e}")
+
+    def add(self, city, tz_name, hour, minute, weekdays=(), label=""):
+        """Create and schedule an alarm; return it."""
+        alarm = Alarm(self.next_id, city, tz_name, hour, minute, weekdays,
+                      label)
+        self.next_id += 1
+        self.alarms[alarm.id] = alarm
+        self._schedule(alarm, zone_engine.source.now())
+        self._changed()
+        return alarm
+
+    def remove(self, alarm_id):
+        """Delete an alarm; its heap entry is dropped lazily."""
+        if self.alarms.pop(alarm_id, None) is not None:
+            self._changed()
+
+    def set_enabled(self, alarm_id, enabled):
+        """Enable or disable an alarm."""
+        alarm = self.alarms[alarm_id]
+        alarm.enabled = enabled
+        if enabled:
+            self._schedule(alarm, zone_engine.source.now())
+        else:
+            alarm.next_fire = None
+        self._changed()
+
+    def clear(self):
+        """Delete every alarm."""
+        self.alarms.clear()
+        self.heap = []
+        self.timer.stop()
+        self._changed()
+
+    def upcoming(self, count):
+        """The next ``count`` enabled alarms, soonest first."""
+        alarms = [alarm for alarm in self.alarms.values()
+                  if alarm.next_fire is not None]
+        return heapq.nsmallest(count, alarms,
+                               key=lambda alarm: alarm.next_fire)
+
+    def _changed(self):
+        """Save once the current batch of changes is done."""
+        self.save_timer.start(0)
+        self.changed.emit()
+
+    def _schedule(self, alarm, after):
+        """Push the alarm's next occurrence and re-arm if it is earliest."""
+        alarm.next_fire = alarm.next_occurrence(after)
+        if alarm.next_fire is None:
+            return
+        heapq.heappush(self.heap, (alarm.next_fire, alarm.id))
+        if self.heap[0][1] == alarm.id:
+            self._arm()
+
+    def _is_current(self, entry):
+        """Whether a heap entry still matches its alarm."""
+        fire_at, alarm_id = entry
+        alarm = self.alarms.get(alarm_id)
+        return alarm is not None and alarm.next_fire == fire_at
+
+    def _arm(self):
+        """Arm the timer for the earliest live entry."""
+        while self.heap and not self._is_current(self.heap[0]):
+            heapq.heappop(self.heap)
+        if not self.heap:
+            self.timer.stop()
+            return
+
+        source = zone_engine.source
+        delay_ms = (self.heap[0][0] - source.now()) * 1000
+        if source.rate:
+            delay_ms /= source.rate
+        # Wake up at least this often to notice clock steps and sleep
+        delay_ms = min(max(0, delay_ms), ClockConfig.ALARM_MAX_SLEEP_MS)
+        self.timer.start(int(delay_ms) + ClockConfig.TICK_MARGIN_MS)
+
+    def _on_timeout(self):
+        """Fire every due alarm and schedule its next occurrence."""
+        # The tick timer may be paused, so pick up a resume from suspend here
+        zone_engine.source.check()
+        now = zone_engine.source.now()
+        while self.heap and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)
+            if not self._is_current(entry):
+                continue
+
+            alarm = self.alarms[entry[1]]
+            if alarm.weekdays:
+                # Occurrences missed while asleep collapse into this one
+                self._schedule(alarm, now)
+            else:
+                alarm.enabled = False
+                alarm.next_fire = None
+                self._changed()
+            self.fired.emit(alarm)
+        self._arm()
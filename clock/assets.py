@@ -0,0 +1,105 @@
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPixmap
+
+from clock.config import ClockConfig
+from clock.loader import read_image, read_scaled_image
+
+
+class AssetManager:
+    """Decodes image assets on first use and keeps them in a bounded LRU.
+
+    SVG assets are rasterized instead, once per requested pixel size.
+    """
+
+    def __init__(self, budget=ClockConfig.ASSET_CACHE_BUDGET):
+        self.budget = budget
+        self.cache = OrderedDict()
+        self.used = 0
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        """Approximate resident size of a decoded pixmap."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    @staticmethod
+    def cache_key(path, size, aspect_mode):
+        """Key of a decoded asset, including its target size if any."""
+        if size is None:
+            return (path,)
+        return (path, size.width(), size.height(), int(aspect_mode))
+
+    def pixmap(self, path, size=None, aspect_mode=Qt.IgnoreAspectRatio):
+        """Return the decoded pixmap for ``path``, loading it if needed.
+
+        With a ``size`` the image is resized to that many device pixels
+        (exactly, unless ``aspect_mode`` says otherwise) and served from
+        the on-disk derived-asset cache when warm.
+        """
+        key = self.cache_key(path, size, aspect_mode)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            self.cache.move_to_end(key)
+            return pixmap
+
+        if size is not None:
+            pixmap = QPixmap.fromImage(
+                read_scaled_image(path, size, aspect_mode))
+        else:
+            pixmap = QPixmap.fromImage(read_image(path))
+        if pixmap.isNull():
+            print(f"Error loading image asset: {path}")
+            return pixmap
+
+        self.cache[key] = pixmap
+        self.used += self.pixmap_bytes(pixmap)
+        self._evict()
+        return pixmap
+
+    def cached(self, path, size=None, aspect_mode=Qt.IgnoreAspectRatio):
+        """Whether ``path`` is already decoded at ``size``."""
+        return self.cache_key(path, size, aspect_mode) in self.cache
+
+    def store(self, path, size, image, aspect_mode=Qt.IgnoreAspectRatio):
+        """Add an image decoded elsewhere, e.g. on a worker thread."""
+        key = self.cache_key(path, size, aspect_mode)
+        previous = self.cache.pop(key, None)
+        if previous is not None:
+            self.used -= self.pixmap_bytes(previous)
+
+        pixmap = QPixmap.fromImage(image)
+        self.cache[key] = pixmap
+        self.used += self.pixmap_bytes(pixmap)
+        self._evict()
+        return pixmap
+
+    def prefetch(self, path, size=None, aspect_mode=Qt.IgnoreAspectRatio):
+        """Decode ``path`` once the event loop is idle."""
+        key = self.cache_key(path, size, aspect_mode)
+        if path and key not in self.cache:
+            QTimer.singleShot(0, lambda: self.pixmap(path, size, aspect_mode))
+
+    def _evict(self):
+        """Drop least recently used assets until within budget."""
+        # Always keep the most recent entry, even if it alone is too big
+        while self.used > self.budget and len(self.cache) > 1:
+            _, pixmap = self.cache.popitem(last=False)
+            self.used -= self.pixmap_bytes(pixmap)
+
+    @staticmethod
+    def asset_name(key):
+        """Readable name for a cache key."""
+        name = os.path.basename(key[0])
+        if len(key) > 1:
+            name += f" @ {key[1]}x{key[2]}"
+        return name
+
+    def memory_report(self):
+        """Return (asset name, bytes) per cached asset, largest first."""
+        return sorted(
+            ((self.asset_name(key), self.pixmap_bytes(pixmap))
+             for key, pixmap in self.cache.items()),
+            key=lambda item: item[1], reverse=True
+        )
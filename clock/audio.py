@@ -1,53 +1,278 @@
 import os
 
-from PyQt5.QtCore import QUrl
-
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from PyQt5.QtCore import QBuffer, QByteArray, QTimer
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtMultimedia import QAudio, QAudioDecoder, QAudioDeviceInfo, \
+    QAudioFormat, QAudioOutput
 
+from clock.bundle import asset_data
 from clock.config import ClockConfig
+from clock.zones import zone_engine
 
 
 class AudioManager:
-    """Manages audio playback for clock ticking sounds."""
+    """Plays pre-decoded ticking sounds on the clock's second boundaries.
+
+    Every sound file, the alarm's first, is decoded to PCM once at
+    startup and trimmed to
+    whole seconds. On the first tick of each wall-clock second ``tick``
+    pushes the one-second slice of the current clip for that second, so
+    every second of sound starts on a tick of the scheduler and looping
+    and switching sounds never re-open or re-decode a file. Frame-rate
+    ticks within the same second push nothing.
+    """
 
     def __init__(self):
         self.sound_files = [os.path.abspath(f) for f in
                             ClockConfig.SOUND_FILES]
+        self.alarm_file = os.path.abspath(ClockConfig.ALARM_SOUND)
         self.current_sound_index = 0
         self.sound_enabled = True
 
-        self.player = QMediaPlayer()
-        self.player.setVolume(100)
-        self.player.mediaStatusChanged.connect(self._on_media_status_changed)
+        # Decoded PCM per sound file, a whole number of seconds long
+        self.clips = {}
+
+        # Wall-clock second whose audio was pushed last
+        self.last_second = None
+
+        # Alarm sound: bytes still to be queued and the read position in
+        # its clip. The alert timer feeds it while ticks may be paused.
+        self.alert_bytes = 0
+        self.alert_cursor = 0
+        self.alert_timer = QTimer()
+        self.alert_timer.setInterval(ClockConfig.ALARM_FEED_MS)
+        self.alert_timer.timeout.connect(self._feed_alert)
+
+        # Whether no clock is on screen; the output stays suspended then
+        self.suspended = False
+
+        self.format = self._output_format()
+        self.bytes_per_second = self.format.bytesForDuration(1_000_000)
+
+        self.output = QAudioOutput(self.format)
+        self.output.setVolume(1.0)
+        # One second plus a margin, so queued sound never runs ahead of
+        # the displayed second by more than the margin
+        self.output.setBufferSize(self.format.bytesForDuration(
+            (1000 + ClockConfig.AUDIO_MARGIN_MS) * 1000))
+        self.device = None
+
+        self.decoder = None
+        self.decoding_file = None
+        self.decode_buffer = None
+        self.decode_data = None
+        self.decode_chunks = []
+        # The alarm first, so an alarm soon after startup is heard
+        self.decode_queue = [self.alarm_file] + self.sound_files
+        self._decode_next()
+
+    @staticmethod
+    def _output_format():
+        """16-bit stereo PCM, or the device's nearest supported format."""
+        audio_format = QAudioFormat()
+        audio_format.setSampleRate(44100)
+        audio_format.setChannelCount(2)
+        audio_format.setSampleSize(16)
+        audio_format.setCodec("audio/pcm")
+        audio_format.setByteOrder(QAudioFormat.LittleEndian)
+        audio_format.setSampleType(QAudioFormat.SignedInt)
+
+        device = QAudioDeviceInfo.defaultOutputDevice()
+        if not device.isFormatSupported(audio_format):
+            audio_format = device.nearestFormat(audio_format)
+        return audio_format
+
+    def _decode_next(self):
+        """Decode the next queued sound file."""
+        if not self.decode_queue:
+            self.decoder = None
+            self.decode_buffer = None
+            self.decode_data = None
+            return
+
+        path = self.decoding_file = self.decode_queue.pop(0)
+        self.decode_chunks = []
+        # Parented so it outlives the signal handlers that replace it
+        decoder = self.decoder = QAudioDecoder(self.output)
+        decoder.setAudioFormat(self.format)
+
+        bundled = asset_data(path)
+        if bundled is None:
+            self.decode_buffer = None
+            self.decode_data = None
+            decoder.setSourceFilename(path)
+        else:
+            # Decode from the mapped bytes without copying them; the
+            # decoder owns neither the buffer nor the bytes behind it
+            self.decode_data = bundled[0]
+            self.decode_buffer = QBuffer()
+            self.decode_buffer.setData(QByteArray.fromRawData(
+                self.decode_data))
+            self.decode_buffer.open(QBuffer.ReadOnly)
+            decoder.setSourceDevice(self.decode_buffer)
+        decoder.bufferReady.connect(lambda: self._on_buffer_ready(decoder))
+        decoder.finished.connect(lambda: self._on_decode_finished(decoder))
+        decoder.error.connect(lambda error: self._on_decode_error(decoder))
+        decoder.start()
+
+    def _on_buffer_ready(self, decoder):
+        """Collect a decoded PCM buffer."""
+        if decoder is not self.decoder:
+            return
+        buffer = decoder.read()
+        self.decode_chunks.append(
+            buffer.constData().asstring(buffer.byteCount()))
+
+    def _on_decode_finished(self, decoder):
+        """Store the decoded clip and continue with the next file."""
+        # A decoder may report both an error and the end of its file
+        if decoder is not self.decoder:
+            return
+        clip = b"".join(self.decode_chunks)
+
+        # Whole seconds only, padded with silence if shorter, so the slice
+        # for any wall-clock second starts where a second of the clip does
+        seconds = max(1, len(clip) // self.bytes_per_second)
+        size = seconds * self.bytes_per_second
+        self.clips[self.decoding_file] = clip[:size].ljust(size, b"\0")
+        self._finish_decoder(decoder)
+
+    def _on_decode_error(self, decoder):
+        """Skip a file that cannot be decoded."""
+        if decoder is not self.decoder:
+            return
+        print(f"Error decoding clock sound {self.decoding_file}: "
+              f"{decoder.errorString()}")
+        self._finish_decoder(decoder)
+
+    def _finish_decoder(self, decoder):
+        """Release a decoder once control has left its signal handlers."""
+        decoder.disconnect()
+        decoder.deleteLater()
+        self._decode_next()
 
     def play(self):
-        """Play the current sound file."""
+        """Start the audio output; sound begins on the next second."""
         try:
-            audio_content = QMediaContent(
-                QUrl.fromLocalFile(self.sound_files[self.current_sound_index])
-            )
-            self.player.setMedia(audio_content)
-            if self.sound_enabled:
-                self.player.play()
+            if self.sound_enabled and self.device is None:
+                self.device = self.output.start()
+                # Pushing now would start mid-second
+                self.last_second = int(zone_engine.source.now())
         except Exception as e:
             print(f"Error playing clock sound: {e}")
 
-    def _on_media_status_changed(self, status):
-        """Replay sound when it ends."""
-        if status == QMediaPlayer.EndOfMedia:
-            self.play()
+    def tick(self):
+        """Queue the current clip's slice for a new wall-clock second."""
+        # The alert timer owns the output while an alarm is ringing
+        if not self.sound_enabled or self.device is None or \
+                self.alert_timer.isActive():
+            return
+
+        # High-rate ticks arrive many times a second; push once per second
+        second = int(zone_engine.source.now())
+        if second == self.last_second:
+            return
+        self.last_second = second
+
+        if self.output.state() == QAudio.StoppedState:
+            self.device = self.output.start()
+
+        clip = self.clips.get(self.sound_files[self.current_sound_index])
+        # More than the margin still queued means the output fell behind
+        # the wall clock; dropping this second lets it catch up. A device
+        # that kept a smaller buffer plays as much of the second as fits.
+        needed = min(self.bytes_per_second, self.output.bufferSize())
+        if not clip or self.output.bytesFree() < needed:
+            return
+        offset = second * self.bytes_per_second % len(clip)
+        self.device.write(clip[offset:offset + self.bytes_per_second])
+
+    def alert(self):
+        """Play the alarm sound for ``ClockConfig.ALARM_SOUND_S`` seconds.
+
+        Plays even while ticking sounds are off or the output is suspended
+        because no clock is on screen; both are restored afterwards. Until
+        the alarm sound is decoded the system beep stands in for it.
+        """
+        if self.alarm_file not in self.clips:
+            QApplication.beep()
+            return
+
+        self.alert_bytes = self.bytes_per_second * ClockConfig.ALARM_SOUND_S
+        self.alert_cursor = 0
+        try:
+            if self.device is None or \
+                    self.output.state() == QAudio.StoppedState:
+                self.device = self.output.start()
+            elif self.output.state() == QAudio.SuspendedState:
+                self.output.resume()
+            self._feed_alert()
+            self.alert_timer.start()
+        except Exception as e:
+            print(f"Error playing alarm sound: {e}")
+
+    def _feed_alert(self):
+        """Queue more of the alarm sound, or wind down once it has played."""
+        clip = self.clips.get(self.alarm_file)
+        if self.alert_bytes > 0 and clip:
+            count = min(self.output.bytesFree(), self.alert_bytes)
+            self.alert_bytes -= count
+            self.alert_cursor = self._write(clip, self.alert_cursor, count)
+            return
+        self.alert_bytes = 0
+
+        # Let the queued samples play out before suspending or stopping
+        if self.output.state() == QAudio.ActiveState and \
+                self.output.bytesFree() < self.output.bufferSize():
+            return
+        self.alert_timer.stop()
+        if not self.sound_enabled:
+            self.output.stop()
+            self.device = None
+        elif self.suspended:
+            self.output.suspend()
+        # Ticking continues from the next second boundary
+        self.last_second = int(zone_engine.source.now())
+
+    def _write(self, clip, cursor, count):
+        """Push ``count`` bytes of ``clip`` from ``cursor``; return the end."""
+        if not clip:
+            return cursor
+        while count > 0:
+            chunk = clip[cursor:cursor + count]
+            self.device.write(chunk)
+            count -= len(chunk)
+            cursor = (cursor + len(chunk)) % len(clip)
+        return cursor
+
+    def suspend(self):
+        """Stop pulling samples while the clock is not shown.
+
+        A ringing alarm plays to the end first.
+        """
+        self.suspended = True
+        if self.device is not None and not self.alert_timer.isActive():
+            self.output.suspend()
+
+    def resume(self):
+        """Continue a suspended output."""
+        self.suspended = False
+        if self.device is not None and \
+                self.output.state() == QAudio.SuspendedState:
+            self.output.resume()
 
     def switch_sound(self):
         """Switch to the next sound file."""
         self.current_sound_index = (self.current_sound_index + 1) % len(
             self.sound_files)
-        self.play()
 
     def toggle(self):
         """Toggle sound on/off."""
         self.sound_enabled = not self.sound_enabled
         if self.sound_enabled:
-            self.player.play()
-        else:
-            self.player.stop()
+            self.play()
+        elif not self.alert_timer.isActive():
+            # A ringing alarm stops the output once it has played
+            self.output.stop()
+            self.device = None
         return self.sound_enabled
@@ -0,0 +1,263 @@
+"""Packed, memory-mapped bundle of the images and sounds in ClockConfig.
+
+The bundle is one file: a fixed header, a JSON index mapping each asset
+name to its offset, length and format, then the encoded files back to
+back. Names are paths relative to the ``clock`` package, so the paths
+in ``ClockConfig`` look assets up unchanged. Build it with
+
+    python -m clock.bundle
+
+and ship it instead of ``clock/medias``. At runtime the file is mapped
+once; an asset's bytes are only touched when it is decoded, and are
+handed out as views of the mapping rather than copies. Assets missing
+from the bundle fall back to loose files, as do loose files in a
+source checkout edited after the bundle was built.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+
+from clock.config import ClockConfig
+
+# magic, version, length of the JSON index that follows the header
+HEADER = struct.Struct("<4sII")
+MAGIC = b"GCPK"
+VERSION = 1
+
+PACKAGE_DIR = os.path.dirname(os.path.realpath(__file__))
+# Loose assets; only present in a source checkout
+MEDIA_DIR = os.path.join(PACKAGE_DIR, "medias")
+
+_bundle = None
+_opened = False
+# Background loaders may ask for the bundle before the GUI thread does
+_open_lock = threading.Lock()
+
+
+def asset_name(path):
+    """Bundle name of an asset path, or None if outside the package."""
+    # String operations only, so a lookup costs no file-system calls
+    path = os.path.abspath(path)
+    if not path.startswith(PACKAGE_DIR + os.sep):
+        return None
+    return path[len(PACKAGE_DIR) + 1:].replace(os.sep, "/")
+
+
+def bundled_paths():
+    """Every image and sound file referenced by ClockConfig."""
+    tables = (ClockConfig.CITY_IMAGES, ClockConfig.ANALOG_STYLES,
+              ClockConfig.DIGITAL_STYLES)
+    paths = [path for table in tables for path in table.values()]
+    paths += ClockConfig.SOUND_FILES + [ClockConfig.ALARM_SOUND]
+    return list(dict.fromkeys(paths))
+
+
+class AssetBundle:
+    """Read-only view of a bundle file through ``mmap``."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            self.map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        self.mtime_ns = stat.st_mtime_ns
+
+        if len(self.map) < HEADER.size:
+            raise ValueError("truncated header")
+        magic, version, index_size = HEADER.unpack_from(self.map)
+        if (magic, version) != (MAGIC, VERSION):
+            raise ValueError("not an asset bundle of this version")
+
+        start = HEADER.size
+        self.index = json.loads(self.map[start:start + index_size])
+        end = max((offset + length
+                   for offset, length, _ in self.index.values()), default=0)
+        if end > len(self.map):
+            raise ValueError("truncated data")
+
+    def drop_stale(self, paths):
+        """Forget entries whose loose file is newer than the bundle.
+
+        Returns the names dropped. Lookups of those assets then read the
+        edited loose files, so a bundle left over in a source tree does
+        not hide changes under ``clock/medias``.
+        """
+        stale = []
+        for path in paths:
+            name = asset_name(path)
+            if name not in self.index:
+                continue
+            try:
+                if os.stat(path).st_mtime_ns > self.mtime_ns:
+                    stale.append(name)
+            except OSError:
+                continue
+        for name in stale:
+            del self.index[name]
+        return stale
+
+    def entry(self, path):
+        """(offset, length, format) of an asset path, or None."""
+        name = asset_name(path)
+        return self.index.get(name) if name else None
+
+    def read(self, path):
+        """Return (memoryview of the encoded bytes, format), or None.
+
+        The view shares the mapped pages instead of copying the asset.
+        """
+        entry = self.entry(path)
+        if entry is None:
+            return None
+        offset, length, format_name = entry
+        return self.view[offset:offset + length], format_name
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+
+def asset_bundle():
+    """The bundle at ``ClockConfig.ASSET_BUNDLE``, or None without one."""
+    if not _opened:
+        with _open_lock:
+            if not _opened:
+                _open_bundle()
+    return _bundle
+
+
+def _open_bundle():
+    """Map the bundle once; ``_opened`` is only set once it is ready."""
+    global _bundle, _opened
+    path = ClockConfig.ASSET_BUNDLE
+    if path and os.path.exists(path):
+        try:
+            bundle = AssetBundle(path)
+        except (OSError, ValueError) as e:
+            print(f"Error opening asset bundle {path}: {e}")
+            bundle = None
+
+        # Shipped builds carry no loose files, so only a source checkout
+        # pays for comparing them against the bundle
+        if bundle is not None and not getattr(sys, "frozen", False) and \
+                os.path.isdir(MEDIA_DIR):
+            stale = bundle.drop_stale(bundled_paths())
+            if stale:
+                print(f"Asset bundle {path} is older than {len(stale)} "
+                      f"source file(s), using those instead; rebuild it "
+                      f"with python -m clock.bundle")
+        _bundle = bundle
+    _opened = True
+
+
+def asset_data(path):
+    """Return (memoryview, format) of a bundled asset, or None."""
+    bundle = asset_bundle()
+    return bundle.read(path) if bundle is not None else None
+
+
+def asset_exists(path):
+    """Whether an asset is bundled or present as a loose file."""
+    bundle = asset_bundle()
+    if bundle is not None and bundle.entry(path) is not None:
+        return True
+    return os.path.exists(path)
+
+
+def asset_stamp(path):
+    """(mtime_ns, size) identifying an asset's current contents.
+
+    Raises OSError like ``os.stat`` when the asset is missing.
+    """
+    bundle = asset_bundle()
+    entry = bundle.entry(path) if bundle is not None else None
+    if entry is not None:
+        return bundle.mtime_ns, entry[1]
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Leading bytes of the encodings bundled assets use
+SIGNATURES = ((b"\x89PNG", "png"), (b"\xff\xd8\xff", "jpg"),
+              (b"ID3", "mp3"), (b"\xff\xfb", "mp3"), (b"RIFF", "wav"),
+              (b"<svg", "svg"), (b"<?xm", "svg"))
+
+
+def sniff_format(path):
+    """Encoding of a file by its leading bytes, else by its extension."""
+    with open(path, "rb") as handle:
+        head = handle.read(4)
+    for signature, format_name in SIGNATURES:
+        if head.startswith(signature):
+            return format_name
+    return os.path.splitext(path)[1].lstrip(".").lower()
+
+
+def build_bundle(output, paths):
+    """Pack ``paths`` into a bundle at ``output``; return the entry count."""
+    entries = []
+    for path in paths:
+        name = asset_name(path)
+        if name is None:
+            raise ValueError(f"{path} is outside the clock package")
+        entries.append((name, path, os.path.getsize(path),
+                        sniff_format(path)))
+
+    # Offsets depend on the index length, which depends on the offsets
+    index = {}
+    index_size = 0
+    while True:
+        offset = HEADER.size + index_size
+        for name, path, size, format_name in entries:
+            index[name] = [offset, size, format_name]
+            offset += size
+        encoded = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        if len(encoded) == index_size:
+            break
+        index_size = len(encoded)
+
+    directory = os.path.dirname(os.path.abspath(output))
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so readers never see halves
+    fd, temp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(HEADER.pack(MAGIC, VERSION, index_size))
+            handle.write(encoded)
+            for _, path, _, _ in entries:
+                with open(path, "rb") as source:
+                    handle.write(source.read())
+        # mkstemp creates owner-only files; the bundle ships with the app
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, output)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack the images and sounds in ClockConfig into one "
+                    "asset bundle.")
+    parser.add_argument("--output", default=ClockConfig.ASSET_BUNDLE,
+                        help="bundle file (default: ClockConfig.ASSET_BUNDLE)")
+    args = parser.parse_args()
+
+    try:
+        count = build_bundle(args.output, bundled_paths())
+    except (OSError, ValueError) as e:
+        print(f"Error building asset bundle: {e}", file=sys.stderr)
+        sys.exit(1)
+    size = os.path.getsize(args.output)
+    print(f"{count} assets, {size / 1024 ** 2:.1f} MB -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
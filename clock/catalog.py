@@ -0,0 +1,172 @@
+import unicodedata
+from bisect import bisect_left
+
+import pytz
+
+from clock.config import ClockConfig
+
+
+def normalize(text):
+    """Lower-case, accent-free text with separators turned into spaces."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    for separator in "_/-":
+        text = text.replace(separator, " ")
+    return " ".join(text.casefold().split())
+
+
+def trigrams(text):
+    """Set of three-character substrings of ``text``."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ZoneEntry:
+    """One selectable city or alias and the zone it maps to."""
+
+    __slots__ = ("city", "tz_name", "detail", "label")
+
+    def __init__(self, city, tz_name, detail):
+        self.city = city
+        self.tz_name = tz_name
+        self.detail = detail
+        self.label = f"{city}  ·  {detail}" if detail else city
+
+
+class ZoneCatalog:
+    """Every IANA zone plus city and country aliases, with a search index.
+
+    Each word of every entry's search text is stored in one sorted list,
+    so a prefix query is a bisect followed by a short scan. Queries with
+    too few prefix hits fall back to trigram matching for typos. Entries
+    are also indexed by (city, zone) and by the area a zone name starts
+    with, so menus look up their cities and regions without a scan.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.words = []
+        self.trigram_index = {}
+        self.places = {}
+        self.areas = {}
+        self.build()
+
+    def build(self):
+        """Create the entries and the prefix and trigram indexes."""
+        countries = {}
+        for code, zones in pytz.country_timezones.items():
+            for tz_name in zones:
+                countries.setdefault(tz_name, pytz.country_names[code])
+
+        # Configured cities first, so their backgrounds are used
+        configured = set()
+        for city, tz_name in ClockConfig.TIME_ZONES.items():
+            self.add(city, tz_name, countries.get(tz_name, tz_name))
+            configured.add((city, tz_name))
+
+        for tz_name in pytz.all_timezones:
+            city = tz_name.rsplit("/", 1)[-1].replace("_", " ")
+            if (city, tz_name) not in configured:
+                self.add(city, tz_name, countries.get(
+                    tz_name, tz_name.split("/", 1)[0]))
+
+        for code, zones in pytz.country_timezones.items():
+            if len(zones) == 1:
+                self.add(pytz.country_names[code], zones[0], zones[0])
+
+        self.words.sort()
+
+    def add(self, city, tz_name, detail):
+        """Append an entry and index its place, area, words and trigrams."""
+        index = len(self.entries)
+        self.entries.append(ZoneEntry(city, tz_name, detail))
+
+        self.places.setdefault((city, tz_name), index)
+        area, slash, _ = tz_name.partition("/")
+        self.areas.setdefault(area + slash, []).append(index)
+
+        text = normalize(f"{city} {detail} {tz_name}")
+        words = text.split()
+        for position in range(len(words)):
+            self.words.append((" ".join(words[position:]), index))
+        for gram in trigrams(normalize(city)):
+            self.trigram_index.setdefault(gram, []).append(index)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def find(self, city, tz_name):
+        """Index of the entry for ``city`` in ``tz_name``, or None."""
+        return self.places.get((city, tz_name))
+
+    def region(self, prefixes):
+        """Indexes of entries whose zone starts with one of ``prefixes``.
+
+        Prefixes naming a whole area, such as ``"Europe/"``, are answered
+        from the area index; ``""`` matches every entry.
+        """
+        if "" in prefixes:
+            return range(len(self.entries))
+
+        indexes = set()
+        for prefix in prefixes:
+            area, slash, rest = prefix.partition("/")
+            if not slash:
+                # Part of an area name: rare, so scan the area names
+                for name, members in self.areas.items():
+                    if name.startswith(prefix):
+                        indexes.update(members)
+            elif not rest:
+                indexes.update(self.areas.get(prefix, ()))
+            else:
+                indexes.update(index for index in
+                               self.areas.get(area + slash, ())
+                               if self.entries[index].tz_name.startswith(
+                                   prefix))
+        return sorted(indexes)
+
+    def search(self, query, limit=ClockConfig.CATALOG_SEARCH_LIMIT):
+        """Indexes of entries matching ``query``, best matches first."""
+        query = normalize(query)
+        if not query:
+            return range(len(self.entries))
+
+        results = []
+        seen = set()
+        position = bisect_left(self.words, (query,))
+        while position < len(self.words) and len(results) < limit:
+            text, index = self.words[position]
+            if not text.startswith(query):
+                break
+            if index not in seen:
+                seen.add(index)
+                results.append(index)
+            position += 1
+
+        if len(results) < limit and len(query) >= 3:
+            results.extend(self.fuzzy(query, seen, limit - len(results)))
+        return results
+
+    def fuzzy(self, query, exclude, limit):
+        """Entries sharing the most city trigrams with ``query``."""
+        grams = trigrams(query)
+        scores = {}
+        for gram in grams:
+            for index in self.trigram_index.get(gram, ()):
+                scores[index] = scores.get(index, 0) + 1
+
+        needed = max(2, len(grams) // 2)
+        ranked = sorted((-score, index) for index, score in scores.items()
+                        if score >= needed and index not in exclude)
+        return [index for _, index in ranked[:limit]]
+
+
+_catalog = None
+
+
+def zone_catalog():
+    """The shared catalog, built on first use."""
+    global _catalog
+    if _catalog is None:
+        _catalog = ZoneCatalog()
+    return _catalog
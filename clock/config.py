@@ -21,9 +21,87 @@ class ClockConfig:
     WINDOW_TITLE = "Global Clock"
 
     # Animation settings
-    FPS = 60
-
-    # Sound files
+    FPS = 60  # Only used while a sweeping second hand is enabled
+    TICK_MARGIN_MS = 2  # Delay past each second boundary before repainting
+    SWEEPING_SECOND_HAND = False
+    CROSSFADE_MS = 250  # Fade between city backgrounds
+    RESIZE_SETTLE_MS = 150  # Idle time before smooth rescaling after resize
+    INACTIVE_FPS = 15  # Sweeping-hand rate while the app is not focused
+    WAKEUP_WINDOW_S = 10  # Span the wakeups-per-second rate is averaged over
+
+    # "painter" draws in ClockWindow.paintEvent, "scene" uses a
+    # QGraphicsScene with one item per clock part
+    RENDER_BACKEND = "painter"
+
+    # Time source: how often the wall clock is re-read, and the difference
+    # from the monotonic estimate treated as a clock step
+    TIME_REANCHOR_S = 60
+    TIME_JUMP_TOLERANCE_MS = 50
+
+    # Time zone menu: IANA prefixes listed under each continent, and the
+    # maximum number of search results
+    CONTINENT_REGIONS = {
+        "Europe": ("Europe/",),
+        "Asia": ("Asia/",),
+        "Africa": ("Africa/",),
+        "North America": ("America/", "US/", "Canada/"),
+        "Australia": ("Australia/", "Pacific/"),
+        "All Zones": ("",),
+    }
+    CATALOG_SEARCH_LIMIT = 200
+
+    # World grid: tz names to show (None shows every menu city) and the tile
+    # edge in pixels below which tiles drop seconds and tick marks
+    GRID_ZONES = None
+    GRID_DETAIL_THRESHOLD = 120
+
+    # Zone timeline: hours shown, slot length in seconds and the local
+    # working hours used to find slots that suit every zone
+    TIMELINE_HOURS = 24
+    TIMELINE_STEP_S = 900
+    WORK_HOURS = (9, 17)
+
+    # Signage mode: (city, style name) per screen, in QApplication.screens()
+    # order; screens not listed cycle through the menu cities
+    SIGNAGE_SCREENS = None
+
+    # Frame-timing instrumentation, enabled by env var or --profile
+    PROFILE_ENV = "GLOBAL_CLOCK_PROFILE"
+    PROFILE_EXPORT_ENV = "GLOBAL_CLOCK_PROFILE_EXPORT"
+    PROFILE_WINDOW = 300  # Samples kept for rolling percentiles
+    PROFILE_EVENT_LIMIT = 200_000  # Events kept for trace export
+
+    # Upper bound for decoded style pixmaps kept in memory
+    ASSET_CACHE_BUDGET = 64 * 1024 * 1024
+
+    # On-disk cache of resized images; None uses the user cache directory
+    DERIVED_CACHE_ENABLED = True
+    DERIVED_CACHE_DIR = None
+    DERIVED_CACHE_BUDGET = 256 * 1024 * 1024  # Least recently used go first
+
+    # Last-frame snapshot shown at launch; None stores it in the user cache
+    # directory, and the scale applies to its device-pixel size
+    SNAPSHOT_ENABLED = True
+    SNAPSHOT_PATH = None
+    SNAPSHOT_SCALE = 0.5
+
+    # Alarms: None keeps them in the per-user data directory. The timer
+    # wakes at least every ALARM_MAX_SLEEP_MS to notice clock steps, and a
+    # firing alarm plays ALARM_SOUND for ALARM_SOUND_S, queued every
+    # ALARM_FEED_MS
+    ALARMS_PATH = None
+    ALARM_MAX_SLEEP_MS = 60_000
+    ALARM_SOUND = resource_path("medias/sounds/Alarm.wav")
+    ALARM_SOUND_S = 2
+    ALARM_FEED_MS = 250
+
+    # Packed images and sounds built by ``python -m clock.bundle``; assets
+    # are read from loose files under medias/ while it does not exist
+    ASSET_BUNDLE = resource_path("medias.pack")
+
+    # Sound files; the audio backend is only loaded when sound is enabled
+    SOUND_ENABLED = True
+    AUDIO_MARGIN_MS = 100  # Output buffer beyond the one second queued
     SOUND_FILES = [
         resource_path("medias/sounds/Ticking-1.mp3"),
         resource_path("medias/sounds/Ticking-2.mp3"),
@@ -84,12 +162,13 @@ class ClockConfig:
         "Tehran": resource_path("medias/backgrounds/Tehran.jpg")
     }
 
-    # Analog clock styles
+    # Analog clock styles, raster images or SVG drawn at the dial size
     ANALOG_STYLES = {
         "Billiard": resource_path(
             "medias/analog_styles/Billiard-modified.png"),
         "Blue-neon": resource_path(
             "medias/analog_styles/Blue-neon-modified.png"),
+        "Minimal": resource_path("medias/analog_styles/Minimal.svg"),
         "Modern-pilot": resource_path(
             "medias/analog_styles/Modern-Pilot-modified.png"),
         "Omega": resource_path(
@@ -0,0 +1,129 @@
+from PyQt5.QtCore import Qt, QPointF, QRect, QRectF
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPixmap, QColor
+
+GLYPHS = "0123456789:"
+PLATE_WIDTH = 600
+PLATE_HEIGHT = 300
+PLATE_RISE = 110  # Height of the plate's top edge above the window centre
+PLATE_CACHE_SIZE = 8
+
+
+class GlyphAtlas:
+    """The digits and ':' pre-rendered side by side into one pixmap."""
+
+    def __init__(self, font, color, ratio):
+        metrics = QFontMetrics(font)
+        self.ascent = metrics.ascent()
+        self.height = metrics.height()
+        self.advances = {g: metrics.horizontalAdvance(g) for g in GLYPHS}
+
+        # Pad each cell so glyphs that overhang their advance are not cut
+        pad = metrics.maxWidth() // 4
+        self.pad = pad
+        self.sources = {}
+
+        width = sum(self.advances.values()) + pad * 2 * len(GLYPHS)
+        self.pixmap = QPixmap(int(width * ratio), int(self.height * ratio))
+        self.pixmap.setDevicePixelRatio(ratio)
+        self.pixmap.fill(Qt.transparent)
+
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(color)
+
+        x = 0
+        for glyph in GLYPHS:
+            cell = self.advances[glyph] + pad * 2
+            painter.drawText(x + pad, self.ascent, glyph)
+            self.sources[glyph] = QRectF(x * ratio, 0, cell * ratio,
+                                         self.height * ratio)
+            x += cell
+        painter.end()
+
+    def text_width(self, text):
+        """Advance width of ``text``."""
+        return sum(self.advances[c] for c in text)
+
+
+class DigitalRenderer:
+    """Digital clock drawing from cached plates and a glyph atlas."""
+
+    # Shared by every renderer, keyed by font, colour and device pixel ratio
+    atlases = {}
+
+    def __init__(self):
+        self.font = QFont("Arial", 100, QFont.Bold)
+        self.font.setStyleHint(QFont.SansSerif)
+        self.color = QColor(30, 30, 30)
+        self.plates = {}
+
+    def atlas(self, ratio):
+        """Return the glyph atlas of this font for a device pixel ratio."""
+        # QFont.key() covers the family, size, weight and style
+        key = (self.font.key(), self.color.rgba(), ratio)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(self.font, self.color,
+                                                   ratio)
+        return atlas
+
+    def plate(self, style_pixmap):
+        """Return the style pixmap scaled to the plate size (cached)."""
+        key = style_pixmap.cacheKey()
+        plate = self.plates.get(key)
+        if plate is None:
+            # Reloaded style pixmaps get new keys, so keep this small
+            if len(self.plates) >= PLATE_CACHE_SIZE:
+                self.plates.clear()
+            plate = style_pixmap.scaled(PLATE_WIDTH, PLATE_HEIGHT,
+                                        Qt.KeepAspectRatio)
+            self.plates[key] = plate
+        return plate
+
+    @staticmethod
+    def plate_origin(width, height):
+        """Top-left corner of the plate."""
+        return int(width / 2 - PLATE_WIDTH / 2), int(height / 2 - PLATE_RISE)
+
+    def bounds(self, width, height, style_pixmap, ratio):
+        """Rectangle covering the plate and the widest possible time."""
+        plate = self.plate(style_pixmap)
+        atlas = self.atlas(ratio)
+        widest = max(atlas.advances[d] for d in "0123456789") * 6 + \
+            atlas.advances[":"] * 2
+
+        x, y = self.plate_origin(width, height)
+        text_x = int(x + (plate.width() - widest) / 2) - atlas.pad
+        baseline = int(y + (plate.height() + atlas.height) / 2.5)
+        text = QRect(text_x, baseline - atlas.ascent,
+                     widest + atlas.pad * 2, atlas.height)
+        return QRect(x, y, plate.width(), plate.height()).united(text)
+
+    def draw_plate(self, painter, width, height, style_pixmap):
+        """Draw the style plate."""
+        x, y = self.plate_origin(width, height)
+        painter.drawPixmap(x, y, self.plate(style_pixmap))
+
+    def draw_time(self, painter, local_time, width, height, style_pixmap):
+        """Blit the HH:MM:SS glyphs centred on the plate."""
+        plate = self.plate(style_pixmap)
+        atlas = self.atlas(painter.device().devicePixelRatioF())
+        text = "%02d:%02d:%02d" % (local_time.hour, local_time.minute,
+                                   local_time.second)
+
+        x, y = self.plate_origin(width, height)
+        text_x = int(x + (plate.width() - atlas.text_width(text)) / 2)
+        baseline = int(y + (plate.height() + atlas.height) / 2.5)
+        top = baseline - atlas.ascent
+
+        for glyph in text:
+            source = atlas.sources[glyph]
+            painter.drawPixmap(
+                QPointF(text_x - atlas.pad, top), atlas.pixmap, source)
+            text_x += atlas.advances[glyph]
+
+    def draw(self, painter, local_time, width, height, style_pixmap):
+        """Draw the plate and the time."""
+        self.draw_plate(painter, width, height, style_pixmap)
+        self.draw_time(painter, local_time, width, height, style_pixmap)
@@ -0,0 +1,146 @@
+import hashlib
+import os
+import struct
+import tempfile
+
+from PyQt5.QtCore import Qt, QStandardPaths
+from PyQt5.QtGui import QImage
+
+from clock.bundle import asset_stamp
+from clock.config import ClockConfig
+
+# magic, version, source mtime_ns, source size, width, height,
+# bytes per line, QImage format
+HEADER = struct.Struct("<4sIqqIIII")
+MAGIC = b"GCLK"
+VERSION = 1
+
+
+def cache_root():
+    """Per-user cache directory of the application."""
+    base = QStandardPaths.writableLocation(
+        QStandardPaths.GenericCacheLocation) or tempfile.gettempdir()
+    return os.path.join(base, "global-clock")
+
+
+def default_cache_dir():
+    """Directory holding display-ready copies of the bundled images."""
+    if ClockConfig.DERIVED_CACHE_DIR:
+        return ClockConfig.DERIVED_CACHE_DIR
+    return os.path.join(cache_root(), "derived")
+
+
+class DerivedAssetCache:
+    """Persistent cache of resized, premultiplied ARGB images.
+
+    Entries are named after the source path, target size and aspect
+    mode; the header records the source mtime and size (those of the
+    asset bundle for packed sources) so edited sources are detected and
+    their entries replaced. Each store prunes the least recently used
+    entries beyond ``ClockConfig.DERIVED_CACHE_BUDGET`` bytes.
+    """
+
+    def __init__(self, directory=None, budget=None):
+        self.directory = directory or default_cache_dir()
+        self.enabled = ClockConfig.DERIVED_CACHE_ENABLED
+        self.budget = ClockConfig.DERIVED_CACHE_BUDGET \
+            if budget is None else budget
+
+    def entry_path(self, source, width, height,
+                   aspect_mode=Qt.KeepAspectRatioByExpanding):
+        """File holding the derived copy of ``source`` at a size."""
+        name = f"{os.path.abspath(source)}|{width}x{height}|" \
+               f"{int(aspect_mode)}"
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".argb")
+
+    def load(self, source, width, height,
+             aspect_mode=Qt.KeepAspectRatioByExpanding):
+        """Return the cached QImage, or None on a miss or stale entry."""
+        if not self.enabled:
+            return None
+
+        path = self.entry_path(source, width, height, aspect_mode)
+        try:
+            stamp = asset_stamp(source)
+            with open(path, "rb") as handle:
+                data = handle.read()
+            # Mark the entry as used; relatime and noatime mounts would not
+            os.utime(path)
+        except OSError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+        magic, version, mtime, size, w, h, stride, fmt = \
+            HEADER.unpack_from(data)
+        if (magic, version, mtime, size) != \
+                (MAGIC, VERSION) + stamp or \
+                len(data) != HEADER.size + stride * h:
+            self._remove(path)
+            return None
+
+        # copy() detaches the image from the temporary buffer
+        return QImage(data[HEADER.size:], w, h, stride, fmt).copy()
+
+    def store(self, source, width, height, image,
+              aspect_mode=Qt.KeepAspectRatioByExpanding):
+        """Write ``image`` as the derived copy of ``source``."""
+        if not self.enabled or image.isNull():
+            return
+
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        path = self.entry_path(source, width, height, aspect_mode)
+        try:
+            mtime, size = asset_stamp(source)
+            os.makedirs(self.directory, exist_ok=True)
+            header = HEADER.pack(MAGIC, VERSION, mtime, size, image.width(),
+                                 image.height(), image.bytesPerLine(),
+                                 image.format())
+            pixels = image.constBits().asstring(image.sizeInBytes())
+
+            # Write to a temporary file first so readers never see halves
+            fd, temp_path = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(header)
+                    handle.write(pixels)
+                os.replace(temp_path, path)
+            except BaseException:
+                self._remove(temp_path)
+                raise
+        except OSError as e:
+            print(f"Error writing derived asset cache: {e}")
+            return
+        self.prune()
+
+    def prune(self):
+        """Delete least recently used entries until within the budget."""
+        files = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".argb"):
+                        stat = entry.stat()
+                        files.append((stat.st_atime, stat.st_size,
+                                      entry.path))
+        except OSError as e:
+            print(f"Error pruning derived asset cache: {e}")
+            return
+
+        used = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if used <= self.budget:
+                break
+            self._remove(path)
+            used -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+derived_cache = DerivedAssetCache()
@@ -0,0 +1,278 @@
+"""Render clock frames offscreen to image files in parallel.
+
+Jobs are read one at a time from a CSV or JSON Lines manifest with the
+columns ``zone``, ``time`` and ``style`` plus optional ``width``,
+``height``, ``background`` and ``output``:
+
+    zone,time,style,width,height
+    Tokyo,2024-01-01T09:00:00,Rolex,1920,1080
+    America/New_York,2024-01-01T14:00:00+00:00,Aqua,1280,720
+
+    python -m clock.export manifest.csv --output-dir frames --jobs 8
+
+``zone`` is a menu city or an IANA name. Naive times are shown as given,
+times with an offset are converted to the zone. ``style`` names an analog
+or digital style. Outputs newer than their style and background images
+are skipped unless ``--force`` is given, as long as the job parameters
+recorded in the ``.job.json`` file beside them are unchanged.
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+import pytz
+
+from clock.bundle import asset_exists, asset_stamp
+from clock.config import ClockConfig
+
+DEFAULT_WIDTH = 1920
+DEFAULT_HEIGHT = 1080
+# Shortest image side whose dial leaves every hand longer than its tip
+MIN_EDGE = 200
+# Bumped when the drawing changes, so up-to-date checks re-render
+LAYOUT_VERSION = 2
+
+# Per-process Qt state, created by init_worker
+_app = None
+_renderer = None
+_assets = None
+
+
+def read_manifest(path):
+    """Yield one job dict per manifest row without loading the whole file."""
+    with open(path, newline="") as handle:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(handle):
+                yield {key: value for key, value in row.items() if value}
+        else:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def resolve_zone(zone):
+    """Return (city, tz_name) for a menu city or an IANA name."""
+    if zone in ClockConfig.TIME_ZONES:
+        return zone, ClockConfig.TIME_ZONES[zone]
+    if zone not in pytz.all_timezones_set:
+        raise ValueError(f"unknown zone {zone!r}")
+    return zone.rsplit("/", 1)[-1].replace("_", " "), zone
+
+
+def resolve_style(style):
+    """Return (is_digital, path) for a style name."""
+    if style in ClockConfig.DIGITAL_STYLES:
+        return True, ClockConfig.DIGITAL_STYLES[style]
+    if style in ClockConfig.ANALOG_STYLES:
+        return False, ClockConfig.ANALOG_STYLES[style]
+    raise ValueError(f"unknown style {style!r}")
+
+
+def prepare(job, output_dir, image_format, quality=-1):
+    """Fill in defaults and the output path of a manifest job."""
+    city, tz_name = resolve_zone(job["zone"])
+    digital, style_path = resolve_style(job["style"])
+    moment = datetime.fromisoformat(job["time"])
+
+    output = job.get("output")
+    if not output:
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", city).strip("-")
+        output = (f"{slug}-{moment:%Y%m%d-%H%M%S}-{job['style']}"
+                  f"-{job.get('width', DEFAULT_WIDTH)}x"
+                  f"{job.get('height', DEFAULT_HEIGHT)}.{image_format}")
+
+    width = int(job.get("width", DEFAULT_WIDTH))
+    height = int(job.get("height", DEFAULT_HEIGHT))
+    if min(width, height) < MIN_EDGE:
+        raise ValueError(f"{width}x{height} is smaller than {MIN_EDGE} "
+                         f"pixels on a side")
+
+    background = job.get("background", city)
+    return {
+        "tz_name": tz_name,
+        "time": job["time"],
+        "digital": digital,
+        "style_path": style_path,
+        "background_path": ClockConfig.CITY_IMAGES.get(background),
+        "width": width,
+        "height": height,
+        "output": os.path.join(output_dir, output),
+        "quality": quality,
+        "layout": LAYOUT_VERSION,
+    }
+
+
+def job_record_path(job):
+    """File beside the output recording the parameters it was made with."""
+    return job["output"] + ".job.json"
+
+
+def job_parameters(job):
+    """Everything besides the inputs' contents that shapes the output."""
+    return {key: value for key, value in job.items() if key != "output"}
+
+
+def up_to_date(job):
+    """Whether the output matches the job and is newer than its inputs."""
+    try:
+        built = os.path.getmtime(job["output"])
+        with open(job_record_path(job)) as handle:
+            if json.load(handle) != job_parameters(job):
+                return False
+    except (OSError, ValueError):
+        return False
+
+    inputs = [job["style_path"], job["background_path"]]
+    return all(asset_stamp(path)[0] / 1e9 <= built
+               for path in inputs if path and asset_exists(path))
+
+
+def init_worker():
+    """Create this process's QGuiApplication, renderer and asset cache."""
+    global _app, _renderer, _assets
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt5.QtGui import QGuiApplication
+    from clock.assets import AssetManager
+    from clock.render import ClockRenderer
+
+    _app = QGuiApplication(["clock-export"])
+    _renderer = ClockRenderer()
+    _assets = AssetManager()
+
+
+def render_frame(job):
+    """Draw one job into a QImage, laid out like the clock window."""
+    from PyQt5.QtCore import Qt, QSize
+    from PyQt5.QtGui import QImage, QPainter
+
+    from clock.utils import get_local_time
+
+    width, height = job["width"], job["height"]
+    moment = datetime.fromisoformat(job["time"])
+    if moment.tzinfo is not None:
+        moment = get_local_time(job["tz_name"], moment.timestamp())
+
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.black)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    if job["background_path"]:
+        background = _assets.pixmap(job["background_path"],
+                                    QSize(width, height),
+                                    Qt.KeepAspectRatioByExpanding)
+        painter.drawPixmap(0, 0, background)
+
+    if job["digital"]:
+        _renderer.draw_digital_clock(painter, moment, width, height,
+                                     _assets.pixmap(job["style_path"]))
+    else:
+        size = int(min(width, height) * 0.8)
+        dial = _assets.pixmap(job["style_path"], QSize(size, size))
+        painter.drawPixmap(int(width / 2 - size / 2),
+                           int(height / 2 - size / 2), dial)
+        _renderer.draw_analog_clock(painter, moment, width, height,
+                                    _renderer.dial_radius_map(size))
+
+    painter.end()
+    return image
+
+
+def export_job(job):
+    """Render and save one job; return (output, error or None)."""
+    try:
+        image = render_frame(job)
+        os.makedirs(os.path.dirname(job["output"]) or ".", exist_ok=True)
+
+        # Write beside the target and rename, so a killed run never
+        # leaves a truncated file that looks up to date
+        root, extension = os.path.splitext(job["output"])
+        partial = f"{root}.partial{extension}"
+        if not image.save(partial, None, job["quality"]):
+            return job["output"], "unsupported format or unwritable path"
+
+        # Drop the old record first so a new image never pairs with it
+        record = job_record_path(job)
+        if os.path.exists(record):
+            os.remove(record)
+        os.replace(partial, job["output"])
+        with open(record, "w") as handle:
+            json.dump(job_parameters(job), handle)
+        return job["output"], None
+    except Exception as e:
+        return job["output"], str(e)
+
+
+def run(manifest, output_dir, jobs, image_format, quality=-1, force=False):
+    """Export every manifest job; return (rendered, skipped, failed)."""
+    rendered = skipped = failed = 0
+    # Bound the jobs in flight so memory stays flat for any manifest size
+    limit = jobs * 4
+    pending = set()
+
+    def collect(done):
+        nonlocal rendered, failed
+        for future in done:
+            output, error = future.result()
+            if error:
+                failed += 1
+                print(f"Error rendering {output}: {error}", file=sys.stderr)
+            else:
+                rendered += 1
+
+    with ProcessPoolExecutor(jobs, initializer=init_worker) as pool:
+        for line, entry in enumerate(read_manifest(manifest), 1):
+            try:
+                job = prepare(entry, output_dir, image_format, quality)
+            except (KeyError, ValueError) as e:
+                failed += 1
+                print(f"Error in manifest entry {line}: {e}", file=sys.stderr)
+                continue
+
+            if not force and up_to_date(job):
+                skipped += 1
+                continue
+
+            pending.add(pool.submit(export_job, job))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        collect(wait(pending).done)
+
+    return rendered, skipped, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render clock frames listed in a manifest to images.")
+    parser.add_argument("manifest", help=".csv or .jsonl job list")
+    parser.add_argument("--output-dir", default="export",
+                        help="directory for the images (default: export)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--format", default="png", choices=("png", "webp"),
+                        help="image format for outputs without a name")
+    parser.add_argument("--quality", type=int, default=80,
+                        help="0-100; for PNG lower values compress harder "
+                             "and save slower (default: 80)")
+    parser.add_argument("--force", action="store_true",
+                        help="re-render outputs that are up to date")
+    args = parser.parse_args()
+
+    rendered, skipped, failed = run(args.manifest, args.output_dir,
+                                    max(1, args.jobs), args.format,
+                                    args.quality, args.force)
+    print(f"{rendered} rendered, {skipped} up to date, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
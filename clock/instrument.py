@@ -0,0 +1,153 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QFont
+
+from clock.config import ClockConfig
+
+_DISABLED = nullcontext()
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class FrameProfiler:
+    """Opt-in timing of ticks and paint phases.
+
+    Records timer jitter (actual minus scheduled fire time), per-phase
+    durations and missed second boundaries. Rolling percentiles are shown
+    in a HUD, and the full event log can be exported as a Chrome trace
+    (``.json``) or CSV.
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get(ClockConfig.PROFILE_ENV, "") not in (
+            "", "0")
+        self.export_path = os.environ.get(ClockConfig.PROFILE_EXPORT_ENV)
+        self.durations = {}
+        self.jitter = deque(maxlen=ClockConfig.PROFILE_WINDOW)
+        self.events = deque(maxlen=ClockConfig.PROFILE_EVENT_LIMIT)
+        self.missed_frames = 0
+        self.wakeup_rate = 0.0
+        self.hud_font = None
+
+    def phase(self, name):
+        """Context manager timing one phase; free when disabled."""
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            samples = self.durations.get(name)
+            if samples is None:
+                samples = self.durations[name] = deque(
+                    maxlen=ClockConfig.PROFILE_WINDOW)
+            samples.append(duration / 1e6)
+            self.events.append(("phase", name, start // 1000,
+                                duration // 1000))
+
+    def record_tick(self, scheduler):
+        """Record how late the scheduler fired and any skipped frames."""
+        if not self.enabled or scheduler.last_lateness_ms is None:
+            return
+
+        lateness = scheduler.last_lateness_ms
+        self.wakeup_rate = scheduler.wakeups_per_second()
+        self.jitter.append(lateness)
+        self.missed_frames += max(0, int(lateness //
+                                         scheduler.last_period_ms))
+        self.events.append(("jitter", "tick", time.perf_counter_ns() // 1000,
+                            int(lateness * 1000)))
+
+    def summary(self):
+        """Rolling (name, p50, p95, p99) rows in milliseconds."""
+        rows = []
+        series = [("tick jitter", self.jitter)] + sorted(
+            self.durations.items())
+        for name, samples in series:
+            ordered = sorted(samples)
+            rows.append((name, percentile(ordered, 0.5),
+                         percentile(ordered, 0.95),
+                         percentile(ordered, 0.99)))
+        return rows
+
+    def hud_rect(self, width):
+        """Area of the HUD overlay in a widget of ``width``."""
+        lines = len(self.durations) + 4
+        return QRect(width - 340, 10, 330, lines * 16 + 10)
+
+    def draw_hud(self, painter, width):
+        """Draw the rolling percentile overlay in the top-right corner."""
+        if self.hud_font is None:
+            self.hud_font = QFont("Monospace", 9)
+            self.hud_font.setStyleHint(QFont.TypeWriter)
+
+        rect = self.hud_rect(width)
+        painter.save()
+        painter.fillRect(rect, QColor(0, 0, 0, 170))
+        painter.setPen(Qt.white)
+        painter.setFont(self.hud_font)
+
+        lines = [f"{'phase (ms)':<18}{'p50':>6}{'p95':>7}{'p99':>7}"]
+        lines += [f"{name[:18]:<18}{p50:6.2f}{p95:7.2f}{p99:7.2f}"
+                  for name, p50, p95, p99 in self.summary()]
+        lines.append(f"missed frames: {self.missed_frames}")
+        lines.append(f"wakeups/s: {self.wakeup_rate:.1f}")
+
+        for index, line in enumerate(lines):
+            painter.drawText(rect.x() + 8, rect.y() + 18 + index * 16, line)
+        painter.restore()
+
+    def export(self, path=None):
+        """Write the event log as a Chrome trace or CSV, by extension."""
+        path = path or self.export_path
+        if not path:
+            return
+
+        try:
+            if path.endswith(".csv"):
+                self.export_csv(path)
+            else:
+                self.export_chrome_trace(path)
+        except OSError as e:
+            print(f"Error exporting frame profile: {e}")
+
+    def export_chrome_trace(self, path):
+        """Write events in the Chrome trace-event JSON format."""
+        trace = []
+        for kind, name, start, value in self.events:
+            if kind == "phase":
+                trace.append({"name": name, "ph": "X", "ts": start,
+                              "dur": value, "pid": 1, "tid": 1})
+            else:
+                trace.append({"name": "tick jitter (us)", "ph": "C",
+                              "ts": start, "pid": 1,
+                              "args": {"lateness": value}})
+        with open(path, "w") as handle:
+            json.dump({"traceEvents": trace,
+                       "displayTimeUnit": "ms"}, handle)
+
+    def export_csv(self, path):
+        """Write events as kind, name, timestamp and duration/lateness."""
+        with open(path, "w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["kind", "name", "timestamp_us", "value_us"])
+            writer.writerows(self.events)
+
+
+frame_profiler = FrameProfiler()
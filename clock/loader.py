@@ -0,0 +1,189 @@
+import atexit
+import os
+
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QObject, QRunnable, \
+    QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPainter
+from PyQt5.QtSvg import QSvgRenderer
+
+from clock.bundle import asset_data
+from clock.diskcache import derived_cache
+
+_pool = None
+
+
+def loader_pool():
+    """Thread pool shared by all background loaders.
+
+    Kept apart from the global pool, which Qt itself uses for image
+    conversions: a loader task waiting for the GIL there could block a
+    conversion started by the GUI thread, and with it the whole app.
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(max(2, QThreadPool.globalInstance()
+                                    .maxThreadCount()))
+        atexit.register(_drain_pool)
+    return _pool
+
+
+def _drain_pool():
+    """Let running loads finish before the interpreter shuts down.
+
+    Qt only waits for its global pool on exit; a worker still decoding
+    into a half-destroyed interpreter crashes the process. Destroying
+    the QApplication first already deletes the pool, which waits too.
+    """
+    if sip.isdeleted(_pool):
+        return
+    _pool.clear()
+    _pool.waitForDone()
+
+
+def open_image(path):
+    """QImageReader for an asset, decoding bundled bytes if it is packed."""
+    bundled = asset_data(path)
+    if bundled is None:
+        return QImageReader(path)
+
+    data, format_name = bundled
+    # fromRawData wraps the mapped bytes without copying them
+    buffer = QBuffer()
+    buffer.setData(QByteArray.fromRawData(data))
+    reader = QImageReader(buffer, format_name.encode("ascii"))
+    # The reader owns neither its device nor the bytes behind it
+    reader.source_buffer = buffer
+    reader.source_data = data
+    return reader
+
+
+def is_vector(path):
+    """Whether an asset is an SVG drawing rather than a raster image."""
+    return os.path.splitext(path)[1].lower() == ".svg"
+
+
+def render_svg(path, size=None, aspect_mode=Qt.IgnoreAspectRatio):
+    """Rasterize an SVG asset at ``size`` pixels, or at its own size."""
+    bundled = asset_data(path)
+    if bundled is None:
+        renderer = QSvgRenderer(path)
+    else:
+        renderer = QSvgRenderer(QByteArray.fromRawData(bundled[0]))
+    if not renderer.isValid():
+        print(f"Error loading image: invalid SVG {path}")
+        return QImage()
+
+    target = renderer.defaultSize()
+    if size is not None and not size.isEmpty():
+        target = target.scaled(size, aspect_mode)
+
+    image = QImage(target, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    renderer.render(painter)
+    painter.end()
+    return image
+
+
+def read_image(path):
+    """Decode an asset at its own size."""
+    if is_vector(path):
+        return render_svg(path)
+    return open_image(path).read()
+
+
+def read_scaled_image(path, size, aspect_mode=Qt.KeepAspectRatioByExpanding):
+    """Decode ``path`` straight to ``size``, via the derived-asset cache."""
+    cacheable = not size.isEmpty()
+    if cacheable:
+        cached = derived_cache.load(path, size.width(), size.height(),
+                                    aspect_mode)
+        if cached is not None:
+            return cached
+
+    if is_vector(path):
+        # Drawn at the target size, so faces stay sharp at any resolution
+        image = render_svg(path, size, aspect_mode)
+        if image.isNull():
+            return image
+    else:
+        reader = open_image(path)
+        reader.setAutoTransform(True)
+
+        source_size = reader.size()
+        if source_size.isValid() and not size.isEmpty():
+            reader.setScaledSize(source_size.scaled(size, aspect_mode))
+
+        image = reader.read()
+        if image.isNull():
+            print(f"Error loading image: {reader.errorString()}")
+            return image
+
+    image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    if cacheable:
+        derived_cache.store(path, size.width(), size.height(), image,
+                            aspect_mode)
+    return image
+
+
+class _LoadTask(QRunnable):
+    """Worker that decodes one image unless it has been superseded."""
+
+    def __init__(self, loader, generation, key, path, size, aspect_mode):
+        super().__init__()
+        self.loader = loader
+        self.generation = generation
+        self.key = key
+        self.path = path
+        self.size = size
+        self.aspect_mode = aspect_mode
+
+    def run(self):
+        if self.generation != self.loader.generation:
+            return
+
+        # A null image reports the failure, so waiters are not left hanging
+        image = read_scaled_image(self.path, self.size, self.aspect_mode)
+        try:
+            if self.generation == self.loader.generation:
+                self.loader.loaded.emit(self.generation, self.key, image)
+        except RuntimeError:
+            # The loader was deleted while this worker was decoding
+            pass
+
+
+class BackgroundLoader(QObject):
+    """Decodes and scales images on a thread pool, latest request wins."""
+
+    loaded = pyqtSignal(int, object, QImage)
+    ready = pyqtSignal(object, QImage)
+    failed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.pool = loader_pool()
+        self.loaded.connect(self._on_loaded)
+
+    def load(self, key, path, size,
+             aspect_mode=Qt.KeepAspectRatioByExpanding):
+        """Start loading ``path`` at ``size``, superseding older requests.
+
+        Superseded tasks return as soon as they start, so several loaders
+        can share one pool without cancelling each other's work.
+        """
+        self.generation += 1
+        self.pool.start(_LoadTask(self, self.generation, key, path, size,
+                                  aspect_mode))
+
+    def _on_loaded(self, generation, key, image):
+        """Forward only the result of the most recent request."""
+        if generation != self.generation:
+            return
+        if image.isNull():
+            self.failed.emit(key)
+        else:
+            self.ready.emit(key, image)
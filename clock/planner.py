@@ -0,0 +1,97 @@
+"""Batch zone conversions for meeting planning.
+
+Every function takes an array of UTC instants (epoch seconds or
+``datetime64``) and a list of IANA zone names, and works on whole arrays:
+each zone's offset lookup is one ``searchsorted`` over its transition
+table instead of a ``get_local_time`` call per instant.
+
+    instants = time_grid(start, start + 14 * 86400, 1800)
+    slots = instants[common_slots(instants, zones, duration=1800)]
+"""
+import numpy as np
+
+from clock.zones import zone_engine
+
+DAY = 86400
+
+# Per-zone (transition starts, offsets) arrays
+_arrays = {}
+
+
+def _zone_arrays(tz_name):
+    """Transition start times and UTC offsets of a zone as arrays."""
+    arrays = _arrays.get(tz_name)
+    if arrays is None:
+        table = zone_engine.table(tz_name)
+        # starts[0] is -inf, so searchsorted over the rest indexes offsets
+        starts = np.array(table.starts[1:], dtype=np.int64)
+        offsets = np.array(table.offsets, dtype=np.int64)
+        arrays = _arrays[tz_name] = (starts, offsets)
+    return arrays
+
+
+def as_epoch(instants):
+    """Epoch seconds as an int64 array."""
+    instants = np.asarray(instants)
+    if np.issubdtype(instants.dtype, np.datetime64):
+        return instants.astype("datetime64[s]").astype(np.int64)
+    return instants.astype(np.int64)
+
+
+def time_grid(start, end, step):
+    """UTC instants from ``start`` up to ``end`` every ``step`` seconds."""
+    return np.arange(int(start), int(end), int(step), dtype=np.int64)
+
+
+def utc_offsets(instants, zones):
+    """UTC offsets in seconds, one row per zone and column per instant."""
+    instants = as_epoch(instants)
+    result = np.empty((len(zones), instants.size), dtype=np.int64)
+    for row, tz_name in enumerate(zones):
+        starts, offsets = _zone_arrays(tz_name)
+        result[row] = offsets[np.searchsorted(starts, instants, "right")]
+    return result
+
+
+def local_seconds(instants, zones, offsets=None):
+    """Local wall-clock time as epoch seconds, shaped like ``utc_offsets``."""
+    instants = as_epoch(instants)
+    if offsets is None:
+        offsets = utc_offsets(instants, zones)
+    return instants + offsets
+
+
+def local_hours(instants, zones, offsets=None):
+    """Local hour of the day as floats in [0, 24)."""
+    seconds = local_seconds(instants, zones, offsets)
+    return (seconds % DAY) / 3600.0
+
+
+def local_weekdays(instants, zones, offsets=None):
+    """Local day of the week, Monday being 0."""
+    seconds = local_seconds(instants, zones, offsets)
+    # 1970-01-01 was a Thursday
+    return (seconds // DAY + 3) % 7
+
+
+def working_mask(instants, zones, start_hour=9, end_hour=17, duration=0,
+                 weekdays_only=False, offsets=None):
+    """Whether ``duration`` seconds from each instant fit working hours.
+
+    One row per zone; a slot must start at or after ``start_hour`` and
+    end by ``end_hour`` local time.
+    """
+    seconds = local_seconds(instants, zones, offsets)
+    of_day = seconds % DAY
+    mask = (of_day >= int(start_hour * 3600)) & \
+        (of_day + int(duration) <= int(end_hour * 3600))
+    if weekdays_only:
+        mask &= (seconds // DAY + 3) % 7 < 5
+    return mask
+
+
+def common_slots(instants, zones, start_hour=9, end_hour=17, duration=0,
+                 weekdays_only=False):
+    """Whether each instant starts a slot inside working hours everywhere."""
+    return working_mask(instants, zones, start_hour, end_hour, duration,
+                        weekdays_only).all(axis=0)
@@ -1,9 +1,10 @@
 import math
 
 from PyQt5.QtCore import Qt, QPointF
-from PyQt5.QtGui import QPen, QBrush, QFont, QColor, QPainterPath
+from PyQt5.QtGui import QPen, QBrush, QPainterPath
 
 from clock.config import ClockConfig
+from clock.digital import DigitalRenderer
 from clock.utils import deg_to_rad
 
 
@@ -12,39 +13,118 @@ class ClockRenderer:
 
     def __init__(self):
         self.clock_60 = {i: i * 6 for i in range(60)}
+        self.sweeping_seconds = ClockConfig.SWEEPING_SECOND_HAND
+
+        # Hand geometry and paint objects keyed by shape and colour
+        self.hand_cache = {}
+        self.center_brush = QBrush(ClockConfig.HOUR_HAND_COLOR)
+        self.center_pen = QPen(Qt.white, 2)
+
+        self.digital = DigitalRenderer()
 
     @staticmethod
-    def draw_sword_hand(painter, color, angle, length, base_width,
+    def radius_map(height):
+        """Hand and digit radii for a clock in a window of ``height``."""
+        radius = height / 2 - 50
+        return {
+            "sec": radius - 100,
+            "min": radius - 150,
+            "hour": radius - 250,
+            "digit": radius - 30
+        }
+
+    @classmethod
+    def dial_radius_map(cls, dial_size):
+        """Radii for a dial of ``dial_size`` pixels at any image size.
+
+        ``radius_map`` subtracts fixed margins, which turn the hands
+        negative in small windows; this scales the layout of a default
+        window, whose dial is 0.8 of its shorter side, instead.
+        """
+        reference = int(min(ClockConfig.WINDOW_WIDTH,
+                            ClockConfig.WINDOW_HEIGHT) * 0.8)
+        scale = dial_size / reference
+        return {name: radius * scale for name, radius in
+                cls.radius_map(ClockConfig.WINDOW_HEIGHT).items()}
+
+    def sword_hand(self, color, length, base_width, tip_length):
+        """Return the cached path, pens and brush for a sword hand."""
+        key = (length, base_width, tip_length, color.rgba())
+        hand = self.hand_cache.get(key)
+        if hand is None:
+            path = QPainterPath()
+
+            base_half = base_width / 2
+
+            path.moveTo(-base_half, 0)
+            path.lineTo(-base_half * 0.3, length - tip_length)
+            path.lineTo(0, length)
+            path.lineTo(base_half * 0.3, length - tip_length)
+            path.lineTo(base_half, 0)
+
+            path.closeSubpath()
+
+            hand = (path, QPen(color.darker(120), 1), QBrush(color),
+                    QPen(color.lighter(130), 2), int(length * 0.7))
+            self.hand_cache[key] = hand
+        return hand
+
+    def invalidate_hands(self):
+        """Drop cached hand geometry, e.g. after the radius map changed."""
+        self.hand_cache.clear()
+
+    @staticmethod
+    def paint_hand(painter, hand):
+        """Draw a cached hand pointing down the y axis from the origin."""
+        path, outline_pen, brush, highlight_pen, highlight_length = hand
+
+        painter.setPen(outline_pen)
+        painter.setBrush(brush)
+        painter.drawPath(path)
+
+        painter.setPen(highlight_pen)
+        painter.drawLine(0, 0, 0, highlight_length)
+
+    def draw_sword_hand(self, painter, color, angle, length, base_width,
                         tip_length, center_x, center_y):
         """Draw a modern sword-shaped clock hand."""
+        hand = self.sword_hand(color, length, base_width, tip_length)
+
         painter.save()
 
         # Translate and rotate
         painter.translate(center_x, center_y)
         painter.rotate(angle - 180)
 
-        path = QPainterPath()
-
-        base_half = base_width / 2
-
-        path.moveTo(-base_half, 0)
-        path.lineTo(-base_half * 0.3, length - tip_length)
-        path.lineTo(0, length)
-        path.lineTo(base_half * 0.3, length - tip_length)
-        path.lineTo(base_half, 0)
-
-        path.closeSubpath()
-
         # Draw
-        painter.setPen(QPen(color.darker(120), 1))
-        painter.setBrush(QBrush(color))
-        painter.drawPath(path)
-
-        painter.setPen(QPen(color.lighter(130), 2))
-        painter.drawLine(0, 0, 0, int(length * 0.7))
+        self.paint_hand(painter, hand)
 
         painter.restore()
 
+    def hand_angles(self, local_time):
+        """Return the hour, minute and second hand angles in degrees."""
+        hour = local_time.hour % 12
+        hour_angle = hour * 30 + local_time.minute * 0.5
+        minute_angle = local_time.minute * 6
+        second_angle = local_time.second * 6
+        if self.sweeping_seconds:
+            second_angle += local_time.microsecond * 6e-6
+        return hour_angle, minute_angle, second_angle
+
+    def hands(self, radius_map):
+        """Cached hour, minute and second hands for a radius map."""
+        return (
+            # Hour hand (shortest, thickest)
+            self.sword_hand(ClockConfig.HOUR_HAND_COLOR, radius_map["hour"],
+                            16, 40),
+            # Minute hand (medium)
+            self.sword_hand(ClockConfig.MINUTE_HAND_COLOR, radius_map["min"],
+                            12, 50),
+            # Second hand (longest, thinnest)
+            self.sword_hand(ClockConfig.SECOND_HAND_COLOR, radius_map["sec"],
+                            6, 30),
+        )
+
     def draw_analog_clock(self, painter, local_time, width, height,
                           radius_map):
         """Draw complete analog clock with sword-shaped hands."""
@@ -53,81 +133,31 @@ class ClockRenderer:
         h_width = width / 2
         h_height = height / 2
 
-        # Calculate angles
-        hour = local_time.hour % 12
-        hour_angle = hour * 30 + local_time.minute * 0.5
-        minute_angle = local_time.minute * 6
-        second_angle = local_time.second * 6
-
-        # Draw hour hand (shortest, thickest)
-        self.draw_sword_hand(
-            painter,
-            ClockConfig.HOUR_HAND_COLOR,
-            hour_angle,
-            radius_map["hour"],
-            16,  # base width
-            40,  # tip length
-            h_width,
-            h_height
-        )
-
-        # Draw minute hand (medium)
-        self.draw_sword_hand(
-            painter,
-            ClockConfig.MINUTE_HAND_COLOR,
-            minute_angle,
-            radius_map["min"],
-            12,  # base width
-            50,  # tip length
-            h_width,
-            h_height
-        )
-
-        # Draw second hand (longest, thinnest)
-        self.draw_sword_hand(
-            painter,
-            ClockConfig.SECOND_HAND_COLOR,
-            second_angle,
-            radius_map["sec"],
-            6,  # base width
-            30,  # tip length
-            h_width,
-            h_height
-        )
+        angles = self.hand_angles(local_time)
+        for hand, angle in zip(self.hands(radius_map), angles):
+            painter.save()
+            painter.translate(h_width, h_height)
+            painter.rotate(angle - 180)
+            self.paint_hand(painter, hand)
+            painter.restore()
 
         # Draw center circle
-        painter.setBrush(QBrush(ClockConfig.HOUR_HAND_COLOR))
-        painter.setPen(QPen(Qt.white, 2))
+        painter.setBrush(self.center_brush)
+        painter.setPen(self.center_pen)
         painter.drawEllipse(QPointF(h_width, h_height), 8.0, 8.0)
 
         painter.restore()
 
-    @staticmethod
-    def draw_digital_clock(painter, local_time, width, height,
+    def draw_digital_clock(self, painter, local_time, width, height,
                            style_pixmap):
         """Draw digital clock display."""
-        font = QFont("Arial", 100, QFont.Bold)
-        font.setStyleHint(QFont.SansSerif)
-        painter.setFont(font)
-
-        time_str = local_time.strftime("%H:%M:%S")
-        painter.setPen(QPen(Qt.white))
-
-        pixmap = style_pixmap.scaled(600, 300, Qt.KeepAspectRatio)
-
-        x = int(width / 2 - 300)
-        y = int(height / 2 - 110)
-        painter.drawPixmap(x, y, pixmap)
-
-        # Draw time text
-        painter.setPen(QPen(QColor(30, 30, 30), 5))
-        painter.setBrush(Qt.transparent)
-
-        text_x = x + (pixmap.width() - painter.fontMetrics().horizontalAdvance(
-            time_str)) / 2
-        text_y = y + (pixmap.height() + painter.fontMetrics().height()) / 2.5
+        self.digital.draw(painter, local_time, width, height, style_pixmap)
 
-        painter.drawText(int(text_x), int(text_y), time_str)
+    def draw_digital_time(self, painter, local_time, width, height,
+                          style_pixmap):
+        """Draw only the digital time text, over an already drawn plate."""
+        self.digital.draw_time(painter, local_time, width, height,
+                               style_pixmap)
 
     @staticmethod
     def _get_clock_position(digit, angle, h_width, h_height, radius):
@@ -0,0 +1,126 @@
+import time
+from collections import deque
+
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+from clock.config import ClockConfig
+from clock.zones import zone_engine
+
+
+class TickScheduler(QObject):
+    """Emits ``tick`` on every wall-clock second boundary.
+
+    A single-shot precise timer is re-armed after each tick for the next
+    boundary, so the clock repaints about once per second without drifting.
+    High-rate mode switches to ``ClockConfig.FPS`` for animated hands, or
+    ``ClockConfig.INACTIVE_FPS`` while throttled. A paused scheduler arms
+    no timer at all, so it causes no wakeups until resumed.
+    Boundaries follow ``zone_engine.source``, including accelerated fakes.
+    """
+
+    tick = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.high_rate = False
+        self.throttled = False
+        self.running = False
+        self.paused = False
+
+        # Timer wakeups, in total and the recent ones for the rate
+        self.wakeups = 0
+        self.wakeup_times = deque()
+
+        # Timing of the last tick, read by the frame profiler
+        self.deadline_ns = None
+        self.last_lateness_ms = None
+        self.last_period_ms = 1000
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._on_timeout)
+
+    def start(self):
+        """Start ticking from the next boundary."""
+        self.running = True
+        if not self.paused:
+            self._arm()
+
+    def stop(self):
+        """Stop ticking."""
+        self.running = False
+        self.timer.stop()
+
+    def set_paused(self, paused):
+        """Stop the timer while nothing is shown; resume on the boundary."""
+        self.paused = paused
+        if paused:
+            self.timer.stop()
+        elif self.running:
+            # The system may have slept meanwhile; re-anchor before arming
+            zone_engine.source.check()
+            self._arm()
+
+    def set_high_rate(self, enabled):
+        """Enable or disable frame-rate ticking for animated hands."""
+        self.high_rate = enabled
+        if self.running and not self.paused:
+            self._arm()
+
+    def set_throttled(self, throttled):
+        """Animate at ``ClockConfig.INACTIVE_FPS`` instead of full rate."""
+        self.throttled = throttled
+        if self.running and not self.paused and self.high_rate:
+            self._arm()
+
+    def frame_interval(self):
+        """Milliseconds between high-rate ticks."""
+        fps = ClockConfig.INACTIVE_FPS if self.throttled else ClockConfig.FPS
+        return int(1000 / fps)
+
+    def wakeups_per_second(self):
+        """Timer wakeups per second over ``ClockConfig.WAKEUP_WINDOW_S``."""
+        self._expire_wakeups(time.monotonic())
+        return len(self.wakeup_times) / ClockConfig.WAKEUP_WINDOW_S
+
+    def _expire_wakeups(self, now):
+        """Forget wakeups older than the rate window."""
+        horizon = now - ClockConfig.WAKEUP_WINDOW_S
+        while self.wakeup_times and self.wakeup_times[0] < horizon:
+            self.wakeup_times.popleft()
+
+    def next_interval(self):
+        """Milliseconds until the next tick should fire."""
+        if self.high_rate:
+            return self.frame_interval()
+
+        source = zone_engine.source
+        if not source.rate:
+            return 1000
+
+        # Land just past the boundary so the new second is always visible
+        remainder = 1000 - (source.now_ns() // 1_000_000) % 1000
+        return int(remainder / source.rate) + ClockConfig.TICK_MARGIN_MS
+
+    def _arm(self):
+        """Arm the timer for the next tick."""
+        interval = self.next_interval()
+        self.deadline_ns = time.monotonic_ns() + interval * 1_000_000
+        self.last_period_ms = self.frame_interval() if self.high_rate \
+            else 1000
+        self.timer.start(interval)
+
+    def _on_timeout(self):
+        """Re-arm first, then notify listeners."""
+        now = time.monotonic()
+        self.wakeups += 1
+        self.wakeup_times.append(now)
+        self._expire_wakeups(now)
+
+        self.last_lateness_ms = \
+            (time.monotonic_ns() - self.deadline_ns) / 1_000_000
+        # Pick up clock steps before computing the next boundary
+        zone_engine.source.check()
+        self._arm()
+        self.tick.emit()
@@ -0,0 +1,144 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QGuiApplication
+from PyQt5.QtWidgets import QApplication
+
+from clock.assets import AssetManager
+from clock.instrument import frame_profiler
+from clock.scheduler import TickScheduler
+
+
+class ClockServices:
+    """Tick source, asset cache, audio engine and alarms for clock windows.
+
+    A standalone ``ClockWindow`` creates its own; signage mode passes one
+    instance to every window so a single timer drives all repaints, each
+    style is decoded once and only one audio output is opened.
+
+    Ticking and sound pause while none of the windows is on screen or the
+    application is hidden, and animation is throttled while the
+    application is not focused.
+    """
+
+    def __init__(self, parent=None):
+        self.scheduler = TickScheduler(parent)
+        # Timed once here; with several windows each would repeat it
+        self.scheduler.tick.connect(self._record_tick)
+        self.assets = AssetManager()
+        self.audio_manager = None
+        self.alarms = None
+
+        # Windows currently animating a sweeping second hand
+        self.high_rate_clients = set()
+
+        # Windows following the tick source and those not on screen
+        self.clients = set()
+        self.hidden_clients = set()
+        self.app_state = Qt.ApplicationActive
+        self.suspended = False
+
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_app_state_changed)
+
+    def _record_tick(self):
+        """Record the timing of a tick for the frame profiler."""
+        frame_profiler.record_tick(self.scheduler)
+
+    def start(self):
+        """Start the shared tick source if it is not running yet."""
+        if not self.scheduler.running:
+            self.scheduler.start()
+
+    def register(self, client):
+        """Follow the tick source; clients count as visible until told."""
+        self.clients.add(client)
+
+    def set_visible(self, client, visible):
+        """Record whether ``client`` is on screen and pause if none is."""
+        if visible:
+            self.hidden_clients.discard(client)
+        else:
+            self.hidden_clients.add(client)
+        self._update_suspension()
+
+    def _on_app_state_changed(self, state):
+        """Pause while hidden and throttle animation while inactive."""
+        self.app_state = state
+        self.scheduler.set_throttled(state != Qt.ApplicationActive)
+        self._update_suspension()
+
+    def _update_suspension(self):
+        """Pause or resume ticking and sound to match visibility."""
+        suspended = self.app_state in (Qt.ApplicationHidden,
+                                       Qt.ApplicationSuspended) or \
+            bool(self.clients) and self.clients <= self.hidden_clients
+        if suspended == self.suspended:
+            return
+        self.suspended = suspended
+
+        self.scheduler.set_paused(suspended)
+        if self.audio_manager is not None:
+            if suspended:
+                self.audio_manager.suspend()
+            else:
+                self.audio_manager.resume()
+
+    def request_high_rate(self, client, enabled):
+        """Tick at frame rate while any client has a sweeping hand."""
+        if enabled:
+            self.high_rate_clients.add(client)
+        else:
+            self.high_rate_clients.discard(client)
+
+        high_rate = bool(self.high_rate_clients)
+        if high_rate != self.scheduler.high_rate:
+            self.scheduler.set_high_rate(high_rate)
+
+    def audio(self):
+        """The audio engine, created on first use with ticking off."""
+        if self.audio_manager is None:
+            # Imported here so QtMultimedia is only loaded when sound is used
+            from clock.audio import AudioManager
+
+            self.audio_manager = AudioManager()
+            self.audio_manager.sound_enabled = False
+            self.audio_manager.suspended = self.suspended
+            self.scheduler.tick.connect(self.audio_manager.tick)
+        return self.audio_manager
+
+    def start_audio(self):
+        """Create the audio engine if needed and start ticking sounds."""
+        audio_manager = self.audio()
+        audio_manager.sound_enabled = True
+        audio_manager.play()
+        if self.suspended:
+            audio_manager.suspend()
+        return audio_manager
+
+    def start_alarms(self):
+        """Load the saved alarms once; they ring through the audio engine."""
+        if self.alarms is None:
+            from clock.alarms import AlarmScheduler
+
+            self.alarms = AlarmScheduler()
+            self.alarms.fired.connect(self._ring)
+            self.alarms.changed.connect(self._prepare_alarm_sound)
+            self.alarms.load()
+            self._prepare_alarm_sound()
+        return self.alarms
+
+    def _prepare_alarm_sound(self):
+        """Decode the alarm sound ahead of time once any alarm is set."""
+        if self.audio_manager is None and self.alarms.upcoming(1):
+            try:
+                self.audio()
+            except Exception as e:
+                print(f"Error loading alarm sound: {e}")
+
+    def _ring(self, alarm):
+        """Play the alarm sound, or the system beep without audio."""
+        try:
+            self.audio().alert()
+        except Exception as e:
+            print(f"Error playing alarm sound: {e}")
+            QApplication.beep()
@@ -0,0 +1,87 @@
+import json
+import os
+import struct
+import tempfile
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+
+from clock.config import ClockConfig
+from clock.diskcache import cache_root
+
+# magic, version, width, height, bytes per line, QImage format,
+# length of the JSON state that follows the header
+HEADER = struct.Struct("<4sIIIIII")
+MAGIC = b"GCSN"
+VERSION = 1
+
+
+class FrameSnapshot:
+    """Downscaled copy of the last face layer plus the state it shows.
+
+    Written when the window closes and read before the first paint, so
+    the background and dial appear at once while the real assets load.
+    Pixels are stored raw, so reading them costs a single file read.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or ClockConfig.SNAPSHOT_PATH or os.path.join(
+            cache_root(), "last-frame.bin")
+
+    def save(self, layer, state):
+        """Store ``layer`` (a QPixmap) and the ``state`` dict behind it."""
+        image = layer.toImage()
+        scale = ClockConfig.SNAPSHOT_SCALE
+        if scale != 1:
+            image = image.scaled(int(image.width() * scale),
+                                 int(image.height() * scale),
+                                 Qt.IgnoreAspectRatio,
+                                 Qt.SmoothTransformation)
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+
+        meta = json.dumps(state).encode("utf-8")
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            header = HEADER.pack(MAGIC, VERSION, image.width(),
+                                 image.height(), image.bytesPerLine(),
+                                 image.format(), len(meta))
+
+            # Write to a temporary file first so readers never see halves
+            fd, temp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(header)
+                handle.write(meta)
+                handle.write(image.constBits().asstring(image.sizeInBytes()))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Error saving last-frame snapshot: {e}")
+
+    def load(self):
+        """Return (QImage, state dict), or None if there is no snapshot."""
+        try:
+            with open(self.path, "rb") as handle:
+                data = handle.read()
+        except OSError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+        magic, version, width, height, stride, fmt, meta_size = \
+            HEADER.unpack_from(data)
+        pixels = HEADER.size + meta_size
+        if (magic, version) != (MAGIC, VERSION) or \
+                len(data) != pixels + stride * height:
+            return None
+
+        try:
+            state = json.loads(data[HEADER.size:pixels])
+        except ValueError:
+            return None
+
+        # copy() detaches the image from the temporary buffer
+        image = QImage(data[pixels:], width, height, stride, fmt).copy()
+        return image, state
+
+
+frame_snapshot = FrameSnapshot()
@@ -0,0 +1,35 @@
+import time
+
+
+class StartupProfiler:
+    """Records how long each startup phase takes.
+
+    Marks are always recorded (a list append); the report is only printed
+    when enabled with ``--startup-profile``.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reported = False
+        self.origin = time.perf_counter()
+        self.marks = []
+
+    def mark(self, name):
+        """Record the end of a startup phase."""
+        self.marks.append((name, time.perf_counter()))
+
+    def report(self):
+        """Print each phase's duration and its offset from launch, once."""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+
+        print(f"{'phase':<20}{'took (ms)':>11}{'at (ms)':>10}")
+        previous = self.origin
+        for name, moment in self.marks:
+            print(f"{name:<20}{(moment - previous) * 1000:11.1f}"
+                  f"{(moment - self.origin) * 1000:10.1f}")
+            previous = moment
+
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,88 @@
+import time
+
+from clock.config import ClockConfig
+
+
+class TimeSource:
+    """Wall-clock time anchored to the monotonic clock.
+
+    The wall clock is read once and then advanced with ``monotonic_ns``,
+    so reads between anchors do not jitter with NTP slewing. The anchor
+    is refreshed every ``ClockConfig.TIME_REANCHOR_S`` seconds, and
+    ``check`` re-anchors right away when the wall clock has stepped, e.g.
+    after an NTP correction or resume from suspend; time can then step
+    back. The monotonic clock stops during system suspend, so callers
+    woken after one should ``check`` before reading the time.
+    """
+
+    rate = 1.0
+
+    def __init__(self):
+        self.reanchor_ns = int(ClockConfig.TIME_REANCHOR_S * 1e9)
+        self.tolerance_ns = int(ClockConfig.TIME_JUMP_TOLERANCE_MS * 1e6)
+        self.jumps = 0
+        self.anchor()
+
+    def anchor(self):
+        """Take a fresh wall-clock reading."""
+        self.mono_anchor_ns = time.monotonic_ns()
+        self.wall_anchor_ns = time.time_ns()
+
+    def now_ns(self):
+        """Current wall time in nanoseconds since the epoch."""
+        elapsed = time.monotonic_ns() - self.mono_anchor_ns
+        if elapsed >= self.reanchor_ns:
+            self.anchor()
+            return self.wall_anchor_ns
+        return self.wall_anchor_ns + elapsed
+
+    def now(self):
+        """Current wall time in seconds since the epoch."""
+        return self.now_ns() / 1e9
+
+    def check(self):
+        """Re-anchor if the wall clock jumped; return whether it did."""
+        predicted = self.wall_anchor_ns + (
+            time.monotonic_ns() - self.mono_anchor_ns)
+        if abs(time.time_ns() - predicted) <= self.tolerance_ns:
+            return False
+        self.jumps += 1
+        self.anchor()
+        return True
+
+
+class FakeTimeSource:
+    """Controllable clock for tests, benchmarks and replays.
+
+    Starts at ``start`` (epoch seconds) and runs ``rate`` times faster than
+    real time; a rate of 0 freezes it so only ``advance`` and ``set`` move
+    it, which makes replays fully deterministic.
+    """
+
+    jumps = 0
+
+    def __init__(self, start, rate=1.0):
+        self.rate = rate
+        self.set(start)
+
+    def set(self, moment):
+        """Jump to ``moment`` (epoch seconds)."""
+        self.mono_anchor_ns = time.monotonic_ns()
+        self.wall_anchor_ns = int(moment * 1e9)
+
+    def advance(self, seconds):
+        """Move forward by ``seconds`` of simulated time."""
+        self.wall_anchor_ns += int(seconds * 1e9)
+
+    def now_ns(self):
+        """Current simulated time in nanoseconds since the epoch."""
+        elapsed = time.monotonic_ns() - self.mono_anchor_ns
+        return self.wall_anchor_ns + int(elapsed * self.rate)
+
+    def now(self):
+        """Current simulated time in seconds since the epoch."""
+        return self.now_ns() / 1e9
+
+    def check(self):
+        """Simulated time never jumps on its own."""
+        return False
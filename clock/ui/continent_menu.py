@@ -4,67 +4,70 @@ from PyQt5.QtWidgets import QPushButton
 
 from PyQt5.QtGui import QCursor
 
-from clock.ui.submenu import HorizontalSubMenu
+from clock.catalog import zone_catalog
+from clock.ui.zone_list import ZoneListPopup
 
 
 class ContinentMenuItem(QPushButton):
-    """A continent menu item with horizontal submenu on hover."""
+    """A continent menu item with a searchable zone list on hover."""
 
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.submenu = None
         self.items = {}
+        self.prefixes = ()
 
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(45)
 
-        # Styling
-        self.setStyleSheet("""
-
-            QPushButton {
-                background-color: rgba(60, 60, 60, 180);
-                border: none;
-                color: white;
-                text-align: left;
-                padding-left: 25px;
-                font-size: 13px;
-                font-weight: bold;
-                border-radius: 4px;
-                margin: 2px 5px;
-            }
-            QPushButton:hover {
-                background-color: rgba(100, 149, 237, 150);
-            }
-        """)
+        # Styled by the sidebar stylesheet
+        self.setObjectName("continentItem")
 
         # Timer for delayed hide
         self.hide_timer = QTimer()
         self.hide_timer.setSingleShot(True)
         self.hide_timer.timeout.connect(self._on_hide_timer)
 
-    def set_submenu_items(self, items_dict):
-        """Set the items for the submenu."""
-        self.items = items_dict
-
-        # Create submenu
-        self.submenu = HorizontalSubMenu(self.window())
+    def set_submenu_items(self, items_dict, prefixes=()):
+        """Set the featured cities and the IANA prefixes of the region.
 
-        # Add items to submenu
-        for city, timezone in items_dict.items():
-            self.submenu.add_item(city, self._on_city_selected)
+        The list is built on first hover and shows the featured cities
+        followed by every other zone under ``prefixes``.
+        """
+        self.items = items_dict
+        self.prefixes = tuple(prefixes)
+        self.submenu = None
 
-    def _on_city_selected(self, city):
+    def _build_submenu(self):
+        """Create the zone list for this continent."""
+        catalog = zone_catalog()
+        featured = sorted(index for index in
+                          (catalog.find(city, tz_name)
+                           for city, tz_name in self.items.items())
+                          if index is not None)
+        rows = featured
+        if self.prefixes:
+            featured_set = set(featured)
+            rows = featured + [index for index in
+                               catalog.region(self.prefixes)
+                               if index not in featured_set]
+
+        self.submenu = ZoneListPopup(rows, self.window())
+        self.submenu.zone_selected.connect(self._on_city_selected)
+
+    def _on_city_selected(self, city, tz_name):
         """Handle city selection."""
-        self.submenu.hide_menu()
         if hasattr(self.window(), 'set_timezone'):
-            self.window().set_timezone(city)
+            self.window().set_timezone(city, tz_name)
 
     def enterEvent(self, event):
         """Show submenu on hover."""
         super().enterEvent(event)
         self.hide_timer.stop()
 
-        if self.submenu and self.items:
+        if self.items or self.prefixes:
+            if self.submenu is None:
+                self._build_submenu()
             self.submenu.show_menu(self)
 
     def leaveEvent(self, event):
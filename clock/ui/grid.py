@@ -0,0 +1,212 @@
+import math
+
+from PyQt5.QtCore import Qt, QRect, QRectF, QPointF
+from PyQt5.QtGui import QPainter, QPixmap, QPen, QColor, QFont
+from PyQt5.QtWidgets import QWidget
+
+from clock.config import ClockConfig
+from clock.zones import zone_engine
+
+
+class ClockTile:
+    """One zone in the grid and the time it currently displays."""
+
+    def __init__(self, label, tz_name):
+        self.label = label
+        self.tz_name = tz_name
+        self.rect = QRect()
+        self.shown = None
+
+
+class WorldGridWidget(QWidget):
+    """Grid of small clocks, one per zone, driven by a shared scheduler.
+
+    Each tick reads UTC once and applies cached per-zone offsets; only the
+    tiles whose displayed time changed are repainted. Tiles smaller than
+    ``ClockConfig.GRID_DETAIL_THRESHOLD`` drop the second hand and tick
+    marks, so they only change once a minute.
+    """
+
+    def __init__(self, scheduler, zones=None, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        self.scheduler = scheduler
+        self.tiles = []
+        self.tile_size = 0
+        self.detailed = True
+        self.face = None
+
+        self.connected = False
+        self.label_font = QFont("Arial")
+        self.time_font = QFont("Arial")
+        self.time_font.setBold(True)
+        self.hour_pen = QPen(ClockConfig.HOUR_HAND_COLOR, 3, Qt.SolidLine,
+                             Qt.RoundCap)
+        self.minute_pen = QPen(ClockConfig.MINUTE_HAND_COLOR, 2,
+                               Qt.SolidLine, Qt.RoundCap)
+        self.second_pen = QPen(ClockConfig.SECOND_HAND_COLOR, 1)
+        self.background = QColor(20, 20, 20)
+
+        self.set_zones(zones or self.default_zones())
+
+    @staticmethod
+    def default_zones():
+        """Configured grid zones, or every city in the time zone menu."""
+        if ClockConfig.GRID_ZONES:
+            return [(tz.rsplit("/", 1)[-1].replace("_", " "), tz)
+                    for tz in ClockConfig.GRID_ZONES]
+        return list(ClockConfig.TIME_ZONES.items())
+
+    def set_zones(self, zones):
+        """Replace the displayed zones with (label, tz name) pairs."""
+        self.tiles = [ClockTile(label, tz_name) for label, tz_name in zones]
+        self.layout_tiles()
+        self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.connected:
+            self.scheduler.tick.connect(self.on_tick)
+            self.connected = True
+        self.on_tick()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.connected:
+            self.scheduler.tick.disconnect(self.on_tick)
+            self.connected = False
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.layout_tiles()
+
+    def layout_tiles(self):
+        """Arrange tiles in a grid of square cells filling the widget."""
+        count = len(self.tiles)
+        if not count or self.width() <= 0 or self.height() <= 0:
+            return
+
+        columns = max(1, math.ceil(math.sqrt(
+            count * self.width() / self.height())))
+        rows = math.ceil(count / columns)
+        cell = min(self.width() // columns, self.height() // rows)
+
+        for index, tile in enumerate(self.tiles):
+            row, column = divmod(index, columns)
+            tile.rect = QRect(column * cell, row * cell, cell, cell)
+            tile.shown = None
+
+        self.tile_size = cell
+        self.detailed = cell >= ClockConfig.GRID_DETAIL_THRESHOLD
+        self.face = None
+
+        self.label_font.setPixelSize(max(7, int(cell * 0.09)))
+        self.time_font.setPixelSize(max(7, int(cell * 0.1)))
+
+    def tile_state(self, tile, now):
+        """Wall time a tile should display, at the detail level in use."""
+        seconds = int(now) + zone_engine.utc_offset(tile.tz_name, now)
+        hour = seconds // 3600 % 24
+        minute = seconds // 60 % 60
+        second = seconds % 60 if self.detailed else None
+        return hour, minute, second
+
+    def on_tick(self):
+        """Repaint only tiles whose displayed time changed."""
+        now = zone_engine.source.now()
+        for tile in self.tiles:
+            state = self.tile_state(tile, now)
+            if state != tile.shown:
+                tile.shown = state
+                self.update(tile.rect)
+
+    def build_face(self):
+        """Render the static dial shared by every tile."""
+        ratio = self.devicePixelRatioF()
+        size = self.tile_size
+        face = QPixmap(int(size * ratio), int(size * ratio))
+        face.setDevicePixelRatio(ratio)
+        face.fill(self.background)
+
+        painter = QPainter(face)
+        painter.setRenderHint(QPainter.Antialiasing)
+        center = QPointF(size / 2, size * 0.38)
+        radius = size * 0.3
+
+        painter.setPen(QPen(QColor(100, 149, 237, 180), 1.5))
+        painter.setBrush(QColor(40, 40, 40))
+        painter.drawEllipse(center, radius, radius)
+
+        if self.detailed:
+            painter.setPen(QPen(Qt.white, 1))
+            for hour in range(12):
+                angle = math.radians(hour * 30)
+                inner = radius * 0.85
+                painter.drawLine(
+                    QPointF(center.x() + inner * math.sin(angle),
+                            center.y() - inner * math.cos(angle)),
+                    QPointF(center.x() + radius * math.sin(angle),
+                            center.y() - radius * math.cos(angle)))
+        painter.end()
+        return face
+
+    @staticmethod
+    def draw_hand(painter, pen, center, angle, length):
+        """Draw one clock hand as a line from the centre."""
+        angle = math.radians(angle)
+        tip = QPointF(center.x() + length * math.sin(angle),
+                      center.y() - length * math.cos(angle))
+        painter.setPen(pen)
+        painter.drawLine(center, tip)
+
+    def paintEvent(self, event):
+        """Paint the tiles that intersect the dirty region."""
+        if self.face is None and self.tile_size > 0:
+            self.face = self.build_face()
+
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.background)
+        if self.face is None:
+            return
+
+        now = zone_engine.source.now()
+        region = event.region()
+        size = self.tile_size
+        radius = size * 0.3
+
+        for tile in self.tiles:
+            if not region.intersects(tile.rect):
+                continue
+
+            if tile.shown is None:
+                tile.shown = self.tile_state(tile, now)
+            hour, minute, second = tile.shown
+
+            painter.drawPixmap(tile.rect.topLeft(), self.face)
+            painter.setRenderHint(QPainter.Antialiasing, self.detailed)
+
+            center = QPointF(tile.rect.x() + size / 2,
+                             tile.rect.y() + size * 0.38)
+            self.draw_hand(painter, self.hour_pen, center,
+                           (hour % 12) * 30 + minute * 0.5, radius * 0.5)
+            self.draw_hand(painter, self.minute_pen, center, minute * 6,
+                           radius * 0.75)
+            if second is not None:
+                self.draw_hand(painter, self.second_pen, center, second * 6,
+                               radius * 0.9)
+
+            text = f"{hour:02d}:{minute:02d}"
+            if second is not None:
+                text += f":{second:02d}"
+
+            painter.setPen(Qt.white)
+            painter.setFont(self.label_font)
+            painter.drawText(QRectF(tile.rect.x(), tile.rect.y() + size * 0.7,
+                                    size, size * 0.13),
+                             Qt.AlignCenter, tile.label)
+            painter.setFont(self.time_font)
+            painter.drawText(QRectF(tile.rect.x(),
+                                    tile.rect.y() + size * 0.83,
+                                    size, size * 0.14),
+                             Qt.AlignCenter, text)
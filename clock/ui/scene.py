@@ -0,0 +1,217 @@
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QFrame, QGraphicsEllipseItem, QGraphicsItem, \
+    QGraphicsPixmapItem, QGraphicsScene, QGraphicsView
+
+from clock.instrument import frame_profiler
+from clock.render import ClockRenderer
+
+
+class HandItem(QGraphicsItem):
+    """One clock hand; ticks only change its rotation."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hand = None
+        self.bounds = QRectF()
+
+    def set_hand(self, hand):
+        """Use a cached hand from ``ClockRenderer.sword_hand``."""
+        self.prepareGeometryChange()
+        self.hand = hand
+        path, outline_pen = hand[0], hand[1]
+        margin = max(outline_pen.widthF(), hand[3].widthF())
+        self.bounds = path.boundingRect().adjusted(-margin, -margin,
+                                                   margin, margin)
+
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, option, widget=None):
+        if self.hand is not None:
+            ClockRenderer.paint_hand(painter, self.hand)
+
+
+class DigitalTimeItem(QGraphicsItem):
+    """HH:MM:SS glyphs drawn over the plate item."""
+
+    def __init__(self, renderer, parent=None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.local_time = None
+        self.style = None
+        self.size = (0, 0)
+        self.bounds = QRectF()
+
+    def configure(self, width, height, style, ratio):
+        """Place the text for a window size and plate style."""
+        self.prepareGeometryChange()
+        self.size = (width, height)
+        self.style = style
+        self.bounds = QRectF(self.renderer.digital.bounds(width, height,
+                                                          style, ratio))
+
+    def set_time(self, local_time):
+        self.local_time = local_time
+        self.update()
+
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, option, widget=None):
+        if self.local_time is not None and self.style is not None:
+            self.renderer.draw_digital_time(painter, self.local_time,
+                                            *self.size, self.style)
+
+
+class HudItem(QGraphicsItem):
+    """Frame profiler overlay."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.width = 0
+
+    def set_width(self, width):
+        """Anchor the overlay to the right edge of ``width``."""
+        self.prepareGeometryChange()
+        self.width = width
+
+    def boundingRect(self):
+        return QRectF(frame_profiler.hud_rect(self.width))
+
+    def paint(self, painter, option, widget=None):
+        frame_profiler.draw_hud(painter, self.width)
+
+
+class ClockSceneView(QGraphicsView):
+    """Renders the clock as a ``QGraphicsScene`` instead of in paintEvent.
+
+    The background, dial and digital plate are static items cached in
+    device coordinates, so a tick only rotates the three hand items (or
+    redraws the digital text) and the scene's BSP index limits the
+    repaint to the area they cover. Static items are rebuilt on the next
+    paint after the window's face layer key changes, so existing
+    ``ClockWindow.update()`` calls keep working.
+    """
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.clock_window = window
+        self.renderer = window.renderer
+        self.key = None
+
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setRenderHint(QPainter.SmoothPixmapTransform)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        # A non-opaque viewport lets ClockWindow.update() reach this view;
+        # the scene's background brush still fills every pixel
+        self.viewport().setAutoFillBackground(False)
+
+        self.graphics_scene = QGraphicsScene(self)
+        self.graphics_scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.graphics_scene.setBackgroundBrush(window.palette().window())
+        self.setScene(self.graphics_scene)
+
+        self.background = self._static(QGraphicsPixmapItem())
+        self.dial = self._static(QGraphicsPixmapItem())
+        self.dial.setTransformationMode(Qt.SmoothTransformation)
+        self.plate = self._static(QGraphicsPixmapItem())
+
+        self.hands = [HandItem() for _ in range(3)]
+        for hand in self.hands:
+            self.graphics_scene.addItem(hand)
+
+        self.center = self._static(QGraphicsEllipseItem(-8, -8, 16, 16))
+        self.center.setBrush(self.renderer.center_brush)
+        self.center.setPen(self.renderer.center_pen)
+
+        self.digital_time = DigitalTimeItem(self.renderer)
+        self.graphics_scene.addItem(self.digital_time)
+
+        self.hud = HudItem()
+        self.hud.setVisible(frame_profiler.enabled)
+        self.graphics_scene.addItem(self.hud)
+
+    def _static(self, item):
+        """Add an item whose pixels are cached between ticks."""
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.graphics_scene.addItem(item)
+        return item
+
+    def sync(self):
+        """Rebuild the static items if the window's face layer changed."""
+        window = self.clock_window
+        key = window.face_layer_cache_key() + (
+            tuple(sorted(window.radius_map.items())),)
+        if key == self.key:
+            return
+        self.key = key
+
+        width, height = window.width(), window.height()
+        self.graphics_scene.setSceneRect(0, 0, width, height)
+        center = QPointF(width / 2, height / 2)
+
+        if window.background_image:
+            with frame_profiler.phase("layer background"):
+                self.background.setPixmap(window.background_image.scaled(
+                    width, height, Qt.KeepAspectRatioByExpanding))
+        self.background.setVisible(bool(window.background_image))
+
+        analog = window.show_clock and not window.is_digital
+        digital = window.show_clock and window.is_digital
+
+        if analog and window.current_style_path:
+            with frame_profiler.phase("layer face"):
+                size = window.dial_size()
+                dial = window.dial_pixmap()
+                self.dial.setPixmap(dial)
+                self.dial.setScale(size / max(1, dial.width()))
+                self.dial.setPos(center.x() - size / 2,
+                                 center.y() - size / 2)
+
+        if analog and window.radius_map:
+            for item, hand in zip(self.hands,
+                                  self.renderer.hands(window.radius_map)):
+                item.set_hand(hand)
+                item.setPos(center)
+        self.center.setPos(center)
+        self.hud.set_width(width)
+
+        if digital:
+            style = window.current_style
+            self.plate.setPixmap(self.renderer.digital.plate(style))
+            self.plate.setPos(*self.renderer.digital.plate_origin(
+                width, height))
+            self.digital_time.configure(width, height, style,
+                                        self.devicePixelRatioF())
+
+        for item in self.hands + [self.dial, self.center]:
+            item.setVisible(analog)
+        for item in (self.plate, self.digital_time):
+            item.setVisible(digital)
+
+        self.set_time(window.local_time)
+
+    def set_time(self, local_time):
+        """Move the hands or update the digital text."""
+        if self.clock_window.is_digital:
+            self.digital_time.set_time(local_time)
+        else:
+            angles = self.renderer.hand_angles(local_time)
+            for item, angle in zip(self.hands, angles):
+                item.setRotation(angle - 180)
+
+        if frame_profiler.enabled:
+            self.hud.update()
+
+    def paintEvent(self, event):
+        """Bring static items up to date, then let the scene paint."""
+        with frame_profiler.phase("paint"):
+            self.sync()
+            super().paintEvent(event)
+        self.clock_window.mark_first_frame()
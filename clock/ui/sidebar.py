@@ -17,11 +17,49 @@ class SidebarPanel(QFrame):
         self.continent_buttons = []
 
         self.setFixedWidth(self.collapsed_width)
+        # One stylesheet for the panel and every button in it, instead of
+        # one per button
         self.setStyleSheet("""
             QFrame {
                 background-color: rgba(30, 30, 30, 230);
                 border-right: 2px solid rgba(100, 149, 237, 150);
             }
+            QPushButton#toggleButton {
+                background-color: rgba(100, 149, 237, 200);
+                border: none;
+                color: white;
+                font-size: 24px;
+                font-weight: bold;
+            }
+            QPushButton#toggleButton:hover {
+                background-color: rgba(100, 149, 237, 255);
+            }
+            QPushButton#menuItem {
+                background-color: rgba(50, 50, 50, 150);
+                border: none;
+                color: white;
+                text-align: left;
+                padding-left: 15px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton#menuItem:hover {
+                background-color: rgba(100, 149, 237, 200);
+            }
+            QPushButton#continentItem {
+                background-color: rgba(60, 60, 60, 180);
+                border: none;
+                color: white;
+                text-align: left;
+                padding-left: 25px;
+                font-size: 13px;
+                font-weight: bold;
+                border-radius: 4px;
+                margin: 2px 5px;
+            }
+            QPushButton#continentItem:hover {
+                background-color: rgba(100, 149, 237, 150);
+            }
         """)
 
         layout = QVBoxLayout(self)
@@ -32,18 +70,7 @@ class SidebarPanel(QFrame):
         self.toggle_btn = QPushButton("☰")
         self.toggle_btn.setFixedHeight(60)
         self.toggle_btn.clicked.connect(self.toggle_sidebar)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(100, 149, 237, 200);
-                border: none;
-                color: white;
-                font-size: 24px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(100, 149, 237, 255);
-            }
-        """)
+        self.toggle_btn.setObjectName("toggleButton")
         layout.addWidget(self.toggle_btn)
 
         self.menu_container = QWidget()
@@ -68,28 +95,15 @@ class SidebarPanel(QFrame):
         """Add a menu item to the sidebar."""
         item = QPushButton(f"{icon}  {title}")
         item.setFixedHeight(50)
-        item.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(50, 50, 50, 150);
-                border: none;
-                color: white;
-                text-align: left;
-                padding-left: 15px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(100, 149, 237, 200);
-            }
-        """)
+        item.setObjectName("menuItem")
         item.setCursor(Qt.PointingHandCursor)
         self.menu_layout.addWidget(item)
         return item
 
-    def add_continent_menu(self, continent, cities):
-        """Add a continent menu with horizontal submenu."""
+    def add_continent_menu(self, continent, cities, prefixes=()):
+        """Add a continent menu with a zone list submenu."""
         continent_btn = ContinentMenuItem(f"🗺  {continent}")
-        continent_btn.set_submenu_items(cities)
+        continent_btn.set_submenu_items(cities, prefixes)
         self.continent_buttons.append(continent_btn)
         return continent_btn
 
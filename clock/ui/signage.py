@@ -0,0 +1,50 @@
+from itertools import cycle
+
+from PyQt5.QtWidgets import QApplication
+
+from clock.config import ClockConfig
+from clock.services import ClockServices
+from clock.ui.window import ClockWindow
+
+
+def screen_assignments(count):
+    """(city, style) for each of ``count`` screens.
+
+    Screens beyond ``ClockConfig.SIGNAGE_SCREENS``, and entries naming a
+    city that is not in the menu, cycle through the menu cities and
+    analog styles.
+    """
+    configured = list(ClockConfig.SIGNAGE_SCREENS or ())
+    cities = cycle(ClockConfig.TIME_ZONES)
+    styles = cycle(ClockConfig.ANALOG_STYLES)
+    assignments = []
+    for index in range(count):
+        if index < len(configured):
+            city, style = configured[index]
+            if city in ClockConfig.TIME_ZONES:
+                assignments.append((city, style))
+                continue
+            print(f"Error in SIGNAGE_SCREENS: unknown city {city!r}")
+        assignments.append((next(cities), next(styles)))
+    return assignments
+
+
+def open_signage_windows(backend=None):
+    """Open a full-screen clock on every screen, sharing one set of services.
+
+    All windows follow the same tick scheduler, asset cache and audio
+    engine, so each additional screen costs little more than its own
+    back buffer.
+    """
+    screens = QApplication.screens()
+    services = ClockServices()
+    windows = []
+
+    for screen, (city, style) in zip(screens,
+                                     screen_assignments(len(screens))):
+        window = ClockWindow(backend=backend, services=services, city=city,
+                             style=style, snapshot=False)
+        window.setGeometry(screen.geometry())
+        window.showFullScreen()
+        windows.append(window)
+    return windows
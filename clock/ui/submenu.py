@@ -17,7 +17,7 @@ class HorizontalSubMenu(QFrame):
         self.layout.setContentsMargins(10, 10, 10, 10)
         self.layout.setSpacing(2)
 
-        # Styling
+        # Styling, including every item button
         self.setStyleSheet("""
             HorizontalSubMenu {
                 background-color: rgba(40, 40, 40, 240);
@@ -25,6 +25,19 @@ class HorizontalSubMenu(QFrame):
                 border-radius: 8px;
                 padding: 5px;
             }
+            QPushButton {
+                background-color: rgba(30, 30, 30, 210);
+                color: white;
+                border: none;
+                padding: 6px 10px;
+                border-radius: 6px;
+            }
+            QPushButton:hover {
+                background-color: rgba(50, 50, 50, 230);
+            }
+            QPushButton:pressed {
+                background-color: rgba(20, 20, 20, 240);
+            }
         """)
 
         self.opacity_effect = QGraphicsOpacityEffect(self)
@@ -65,21 +78,6 @@ class HorizontalSubMenu(QFrame):
         btn = QPushButton(text)
         btn.setFixedHeight(35)
         btn.setMinimumWidth(150)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(30, 30, 30, 210);
-                color: white;
-                border: none;
-                padding: 6px 10px;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: rgba(50, 50, 50, 230);
-            }
-            QPushButton:pressed {
-                background-color: rgba(20, 20, 20, 240);
-            }
-            """)
 
         btn.clicked.connect(lambda checked=False, t=text: callback(t))
         self.layout.addWidget(btn)
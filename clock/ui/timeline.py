@@ -0,0 +1,209 @@
+import numpy as np
+
+from PyQt5.QtCore import Qt, QRect, QRectF
+from PyQt5.QtGui import QPainter, QPixmap, QPen, QColor, QFont
+from PyQt5.QtWidgets import QWidget
+
+from clock import planner
+from clock.config import ClockConfig
+from clock.ui.grid import WorldGridWidget
+from clock.zones import zone_engine
+
+
+class ZoneTimelineWidget(QWidget):
+    """Local hours of several zones side by side over the coming day.
+
+    Each row shows one zone's day split into ``ClockConfig.TIMELINE_STEP_S``
+    slots, shaded by working hours, night and the hours in between, and
+    the slots that are working hours in every zone are outlined. All
+    slots are converted in one batch through ``clock.planner``; the chart
+    is rebuilt only when the first slot changes, and ticks just move the
+    "now" marker.
+    """
+
+    def __init__(self, scheduler, zones=None, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+        self.scheduler = scheduler
+        self.zones = []
+        self.instants = None
+        self.hours = None
+        self.overlap = None
+        self.chart = None
+        self.marker_x = None
+
+        self.connected = False
+        self.label_font = QFont("Arial")
+        self.hour_font = QFont("Arial")
+        self.background = QColor(20, 20, 20)
+        self.work_color = QColor(100, 149, 237)
+        self.shoulder_color = QColor(60, 80, 110)
+        self.night_color = QColor(35, 38, 48)
+        self.overlap_pen = QPen(QColor(240, 200, 90), 2)
+        self.now_pen = QPen(ClockConfig.SECOND_HAND_COLOR, 2)
+
+        self.set_zones(zones or WorldGridWidget.default_zones())
+
+    def set_zones(self, zones):
+        """Replace the displayed zones with (label, tz name) pairs."""
+        self.zones = list(zones)
+        self.instants = None
+        self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.connected:
+            self.scheduler.tick.connect(self.on_tick)
+            self.connected = True
+        self.on_tick()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.connected:
+            self.scheduler.tick.disconnect(self.on_tick)
+            self.connected = False
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.chart = None
+
+    def refresh(self, now):
+        """Convert the slots of the coming day for every zone at once."""
+        step = ClockConfig.TIMELINE_STEP_S
+        first = int(now) // step * step
+        if self.instants is not None and self.instants[0] == first:
+            return
+
+        self.instants = planner.time_grid(
+            first, first + ClockConfig.TIMELINE_HOURS * 3600, step)
+        tz_names = [tz_name for _, tz_name in self.zones]
+        offsets = planner.utc_offsets(self.instants, tz_names)
+        self.hours = planner.local_hours(self.instants, tz_names, offsets)
+
+        start, end = ClockConfig.WORK_HOURS
+        self.overlap = planner.working_mask(
+            self.instants, tz_names, start, end, step,
+            offsets=offsets).all(axis=0)
+        self.chart = None
+
+    def label_width(self):
+        return min(160, self.width() // 4)
+
+    def row_height(self):
+        return max(1, (self.height() - 24) // max(1, len(self.zones)))
+
+    def slot_x(self, index):
+        """Left edge of slot ``index``."""
+        width = self.width() - self.label_width()
+        return self.label_width() + width * index / len(self.instants)
+
+    def slot_color(self, hour):
+        """Shade of a slot by the local hour it starts at."""
+        start, end = ClockConfig.WORK_HOURS
+        if start <= hour < end:
+            return self.work_color
+        if 7 <= hour < 22:
+            return self.shoulder_color
+        return self.night_color
+
+    def build_chart(self):
+        """Render the rows, hour labels and overlap outlines."""
+        ratio = self.devicePixelRatioF()
+        chart = QPixmap(int(self.width() * ratio),
+                        int(self.height() * ratio))
+        chart.setDevicePixelRatio(ratio)
+        chart.fill(self.background)
+
+        painter = QPainter(chart)
+        row_height = self.row_height()
+        label_width = self.label_width()
+        slots = len(self.instants)
+        edges = [int(self.slot_x(index)) for index in range(slots + 1)]
+        per_hour = 3600 // ClockConfig.TIMELINE_STEP_S
+        label_every = next(
+            (hours for hours in (1, 2, 3, 6, 12)
+             if edges[min(slots, hours * per_hour)] - edges[0] >= 24), 24)
+
+        self.label_font.setPixelSize(max(7, min(14, int(row_height * 0.4))))
+        self.hour_font.setPixelSize(max(7, min(11, int(row_height * 0.3))))
+
+        for row, (label, _) in enumerate(self.zones):
+            top = 24 + row * row_height
+            hours = self.hours[row]
+
+            painter.setPen(Qt.white)
+            painter.setFont(self.label_font)
+            painter.drawText(QRect(8, top, label_width - 12, row_height),
+                             Qt.AlignVCenter | Qt.AlignLeft, label)
+
+            for index in range(slots):
+                painter.fillRect(QRect(edges[index], top + 1,
+                                       edges[index + 1] - edges[index],
+                                       row_height - 2),
+                                 self.slot_color(hours[index]))
+
+            # Local hour at whole hours the label spacing allows
+            painter.setPen(QColor(230, 230, 230))
+            painter.setFont(self.hour_font)
+            for index in np.flatnonzero(hours % label_every == 0):
+                painter.drawText(QRect(edges[index] + 2, top, 40, row_height),
+                                 Qt.AlignVCenter | Qt.AlignLeft,
+                                 str(int(hours[index])))
+
+        # Outline each run of slots that suits every zone
+        painter.setPen(self.overlap_pen)
+        painter.setBrush(Qt.NoBrush)
+        bottom = 24 + len(self.zones) * row_height
+        changes = np.flatnonzero(np.diff(np.concatenate(
+            ([False], self.overlap, [False])).astype(np.int8)))
+        for begin, end in zip(changes[::2], changes[1::2]):
+            painter.drawRect(QRectF(edges[begin], 2, edges[end] - edges[begin],
+                                    bottom - 2))
+
+        painter.setPen(Qt.white)
+        painter.setFont(self.label_font)
+        painter.drawText(QRect(8, 0, self.width() - 16, 22), Qt.AlignVCenter,
+                         f"Next {ClockConfig.TIMELINE_HOURS} h — outlined: "
+                         f"{ClockConfig.WORK_HOURS[0]:02d}:00–"
+                         f"{ClockConfig.WORK_HOURS[1]:02d}:00 everywhere")
+        painter.end()
+        return chart
+
+    def marker_position(self, now):
+        """X coordinate of the current time."""
+        step = ClockConfig.TIMELINE_STEP_S
+        return int(self.slot_x((now - self.instants[0]) / step))
+
+    def on_tick(self):
+        """Rebuild on a new slot, otherwise move the marker if needed."""
+        if not self.zones:
+            return
+        now = zone_engine.source.now()
+        self.refresh(now)
+        if self.chart is None:
+            self.update()
+            return
+
+        x = self.marker_position(now)
+        if x != self.marker_x:
+            for old in (self.marker_x, x):
+                if old is not None:
+                    self.update(QRect(old - 2, 0, 4, self.height()))
+
+    def paintEvent(self, event):
+        """Blit the chart and draw the "now" marker."""
+        painter = QPainter(self)
+        if not self.zones or self.width() <= 0:
+            painter.fillRect(event.rect(), self.background)
+            return
+
+        now = zone_engine.source.now()
+        self.refresh(now)
+        if self.chart is None:
+            self.chart = self.build_chart()
+
+        painter.drawPixmap(0, 0, self.chart)
+        self.marker_x = self.marker_position(now)
+        painter.setPen(self.now_pen)
+        painter.drawLine(self.marker_x, 0, self.marker_x, self.height())
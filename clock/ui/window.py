@@ -1,18 +1,23 @@
-import os
-import pytz
-
-from PyQt5.QtCore import Qt, QTimer, QUrl
+from PyQt5.QtCore import Qt, QUrl, QRect, QSize, QTimer, QVariantAnimation
 
 from PyQt5.QtGui import QPainter, QPixmap
-from PyQt5.QtWidgets import QWidget, QMessageBox, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QInputDialog, QMessageBox, \
+    QVBoxLayout
 
 from PyQt5.QtGui import QDesktopServices
 
-from clock.audio import AudioManager
+from clock.bundle import asset_exists
+from clock.catalog import zone_catalog
+from clock.instrument import frame_profiler
+from clock.loader import BackgroundLoader
 from clock.render import ClockRenderer
+from clock.services import ClockServices
+from clock.snapshot import frame_snapshot
+from clock.startup import startup_profiler
 from clock.ui import submenu, sidebar
 
 from clock.utils import get_local_time, get_next_style
+from clock.zones import zone_engine
 
 from clock.config import ClockConfig
 
@@ -22,60 +27,177 @@ class ClockWindow(QWidget):
 
     timezone_expanded: False
 
-    def __init__(self):
+    def __init__(self, backend=None, services=None, city=None, style=None,
+                 snapshot=None):
         super().__init__()
+        self.backend = backend or ClockConfig.RENDER_BACKEND
+        self.scene_view = None
 
-        self.audio_manager = AudioManager()
-        self.renderer = ClockRenderer()
-        self.sidebar = sidebar.SidebarPanel()
-        self.display_submenu = submenu.HorizontalSubMenu()
-        self.continent_container = QWidget()
-        self.continent_layout = QVBoxLayout()
-        self.timer = QTimer()
+        # Tick source, style cache and audio engine, possibly shared with
+        # the windows on other screens
+        self.services = services or ClockServices(self)
 
-        self.is_digital = False
+        # Submenus and continent buttons are created on demand
+        self.renderer = ClockRenderer()
+        self.sidebar = None
+        self.display_submenu = None
+        self.continent_container = None
+        self.continent_layout = None
+        self.scheduler = None
+        self.first_frame_shown = False
+
+        # Whether the window is on screen; ticks pause while it is not
+        self.exposed = True
+        self.watched_handle = None
+
+        self.is_digital = style in ClockConfig.DIGITAL_STYLES
         self.show_clock = True
-        self.selected_tz = pytz.timezone("Asia/Tehran")
-        self.local_time = get_local_time("Asia/Tehran")
 
         # Default city
-        self.current_city = "Tehran"
+        self.current_city = city or "Tehran"
+        self.selected_tz = ClockConfig.TIME_ZONES[self.current_city]
+
+        # The last frame of the previous run, shown until the real
+        # background and dial are ready; it also restores city and style
+        self.use_snapshot = ClockConfig.SNAPSHOT_ENABLED \
+            if snapshot is None else snapshot
+        self.snapshot = None
+        self.snapshot_origin = None
+        self.awaiting_background = False
+        # City whose image was behind the snapshot; cities without an
+        # image keep showing the previous one
+        self.snapshot_background = None
+        if self.use_snapshot and city is None and style is None:
+            self.restore_snapshot()
+
+        self.local_time = get_local_time(self.selected_tz)
+        # UTC second last drawn by a tick, to skip frame-rate ticks in it
+        self.shown_second = None
 
         # Initial graphics variables
         self.background_image = None
-        self.cached_image = None
-        self.cached_size = None
-        self.sidebar.add_menu_item = None
+        self.background_city = None
+        self.face_layer = None
+        self.face_layer_key = None
+        self.previous_layer = None
+
+        # Backgrounds are decoded off the GUI thread and faded in
+        self.loader = BackgroundLoader(self)
+        self.loader.ready.connect(self._on_background_ready)
+        self.loader.failed.connect(self._on_background_failed)
+        self.fade = QVariantAnimation(self)
+        self.fade.setDuration(ClockConfig.CROSSFADE_MS)
+        self.fade.setStartValue(0.0)
+        self.fade.setEndValue(1.0)
+        self.fade.valueChanged.connect(lambda value: self.update())
+        self.fade.finished.connect(self._on_fade_finished)
         self.display_menu_btn = None
         self.timezone_menu_btn = None
         self.radius_map = {}
 
+        self.world_grid = None
+        self.timeline = None
+
         # Initial audio variables
         self.audio_menu_btn = None
         self.audio_submenu = None
 
+        # Initial alarm variables
+        self.alarm_menu_btn = None
+        self.alarm_submenu = None
+
         # Initial info variables
         self.info_menu_btn = None
         self.info_submenu = None
 
-        self.analog_styles = {k: QPixmap(v) for k, v in
-                              ClockConfig.ANALOG_STYLES.items()}
-        self.digital_styles = {k: QPixmap(v) for k, v in
-                               ClockConfig.DIGITAL_STYLES.items()}
-
-        self.current_style = self.analog_styles["Omega"]
+        # While resizing, stretched stand-ins are drawn with fast scaling;
+        # crisp versions are decoded off-thread once resizing settles
+        self.resizing = False
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(ClockConfig.RESIZE_SETTLE_MS)
+        self.resize_timer.timeout.connect(self._on_resize_settled)
+        self.dial_proxy = None
+        self.dial_loader = BackgroundLoader(self)
+        self.dial_loader.ready.connect(self._on_dial_ready)
+
+        # Style pixmaps are decoded on first use
+        self.assets = self.services.assets
+        if self.snapshot is None:
+            self.current_style_path = self.style_table().get(
+                style, ClockConfig.ANALOG_STYLES["Omega"])
 
         self.setup_ui()
         self.setup_timer()
 
         # Load initial background
-        self.update_background("Tehran")
+        self.awaiting_background = self.update_background(
+            self.snapshot_background or self.current_city)
+
+    def restore_snapshot(self):
+        """Load the last-frame snapshot and the state it was taken in."""
+        if self.backend != "painter":
+            return
+        loaded = frame_snapshot.load()
+        if loaded is None:
+            return
+
+        image, state = loaded
+        try:
+            if not asset_exists(state["style_path"]):
+                return
+            get_local_time(state["tz_name"])
+        except Exception:
+            return
+
+        self.current_city = state["city"]
+        self.selected_tz = state["tz_name"]
+        self.current_style_path = state["style_path"]
+        self.is_digital = state["is_digital"]
+        self.show_clock = state["show_clock"]
+        self.snapshot = image
+        self.snapshot_origin = self.snapshot_state()
+        if state.get("background_city") in ClockConfig.CITY_IMAGES:
+            self.snapshot_background = state["background_city"]
+
+    def snapshot_state(self):
+        """What the face layer shows, stored next to the snapshot."""
+        return {
+            "city": self.current_city,
+            "tz_name": self.selected_tz,
+            "style_path": self.current_style_path,
+            "is_digital": self.is_digital,
+            "show_clock": self.show_clock,
+        }
 
-        self.audio_manager.play()
+    def snapshot_fits(self):
+        """Whether the snapshot still shows this window's state and shape.
+
+        Any change the user makes during startup, or a window whose
+        aspect ratio differs from the saved frame, drops the snapshot in
+        favour of a real face layer.
+        """
+        if self.snapshot_state() != self.snapshot_origin:
+            return False
+        image = self.snapshot
+        return abs(image.width() * self.height() -
+                   image.height() * self.width()) <= \
+            0.01 * image.width() * self.height()
+
+    def release_snapshot(self):
+        """Swap in the real face layer once shown and the background is in."""
+        if self.snapshot is None or not self.first_frame_shown or \
+                self.awaiting_background:
+            return
+        self.snapshot = None
+        self.face_layer_key = None
+        self.update()
 
     def setup_ui(self):
         """Set up the main window UI."""
         self.setWindowTitle(ClockConfig.WINDOW_TITLE)
+        # paintEvent always covers the dirty region with the face layer
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         self.setGeometry(100, 100, ClockConfig.WINDOW_WIDTH,
                          ClockConfig.WINDOW_HEIGHT)
 
@@ -83,56 +205,68 @@ class ClockWindow(QWidget):
         self.sidebar = sidebar.SidebarPanel(self)
         self.sidebar.setGeometry(0, 0, 60, self.height())
 
+        if self.backend == "scene":
+            from clock.ui.scene import ClockSceneView
+            self.scene_view = ClockSceneView(self)
+            self.scene_view.lower()
+
         # Display menu with submenu
         self.display_menu_btn = self.sidebar.add_menu_item("🎨", "Display")
-        self.display_submenu = submenu.HorizontalSubMenu(self)
-        self.display_submenu.add_item("Toggle Clock Mode",
-                                      self._toggle_mode_action)
-        self.display_submenu.add_item("Change Clock Style",
-                                      self._change_style_action)
-        self.display_submenu.add_item("Toggle Clock Visibility",
-                                      self._toggle_visibility_action)
         self.display_menu_btn.clicked.connect(self.show_display_menu)
 
         # Time Zone menu
         self.timezone_menu_btn = self.sidebar.add_menu_item("🌍", "Time Zone")
         self.timezone_expanded = False
-
-        # Create a container widget for continents
-        self.continent_container = QWidget()
-        self.continent_layout = QVBoxLayout(self.continent_container)
-        self.continent_layout.setContentsMargins(0, 0, 0, 0)
-        self.continent_layout.setSpacing(2)
-        self.sidebar.menu_layout.addWidget(self.continent_container)
-        self.continent_container.hide()
         self.timezone_menu_btn.clicked.connect(self.toggle_timezone_menu)
 
-        # Add continents to the container
-        for continent, cities in ClockConfig.TIME_ZONES_BY_CONTINENT.items():
-            continent_btn = self.sidebar.add_continent_menu(continent, cities)
-            self.continent_layout.addWidget(continent_btn)
-            self.sidebar.menu_layout.removeWidget(continent_btn)
-
         # Audio menu
         self.audio_menu_btn = self.sidebar.add_menu_item("🔊", "Audio")
-        self.audio_submenu = submenu.HorizontalSubMenu(self)
-        self.audio_submenu.add_item("Toggle Sound On/Off",
-                                    self._toggle_sound_action)
-        self.audio_submenu.add_item("Switch Sound Effect",
-                                    self._switch_sound_action)
         self.audio_menu_btn.clicked.connect(self.show_audio_menu)
 
+        # Alarms menu
+        self.alarm_menu_btn = self.sidebar.add_menu_item("⏰", "Alarms")
+        self.alarm_menu_btn.clicked.connect(self.show_alarm_menu)
+
         # Info menu
         self.info_menu_btn = self.sidebar.add_menu_item("?", "Info")
-        self.info_submenu = submenu.HorizontalSubMenu(self)
-        self.info_submenu.add_item("About", self._show_about_action)
-        self.info_submenu.add_item("Support", self._open_support_action)
-
-        # Connect info menu button to show submenu
         self.info_menu_btn.clicked.connect(self.show_info_menu)
 
+    def build_submenu(self, items):
+        """Create a submenu from (text, callback) pairs."""
+        menu = submenu.HorizontalSubMenu(self)
+        for text, callback in items:
+            menu.add_item(text, callback)
+        return menu
+
+    def build_continent_menu(self):
+        """Create the continent buttons the first time they are shown."""
+        self.continent_container = QWidget()
+        self.continent_layout = QVBoxLayout(self.continent_container)
+        self.continent_layout.setContentsMargins(0, 0, 0, 0)
+        self.continent_layout.setSpacing(2)
+
+        # Keep the continents right below the Time Zone button
+        index = self.sidebar.menu_layout.indexOf(self.timezone_menu_btn)
+        self.sidebar.menu_layout.insertWidget(index + 1,
+                                              self.continent_container)
+
+        for continent, prefixes in ClockConfig.CONTINENT_REGIONS.items():
+            cities = ClockConfig.TIME_ZONES_BY_CONTINENT.get(continent, {})
+            continent_btn = self.sidebar.add_continent_menu(continent, cities,
+                                                            prefixes)
+            self.continent_layout.addWidget(continent_btn)
+
     def show_display_menu(self):
         """Show display submenu."""
+        if self.display_submenu is None:
+            self.display_submenu = self.build_submenu([
+                ("Toggle Clock Mode", self._toggle_mode_action),
+                ("Change Clock Style", self._change_style_action),
+                ("Toggle Clock Visibility", self._toggle_visibility_action),
+                ("Toggle Sweeping Hand", self._toggle_sweep_action),
+                ("Toggle World Grid", self._toggle_grid_action),
+                ("Toggle Zone Timeline", self._toggle_timeline_action),
+            ])
         self.display_submenu.show_menu(self.display_menu_btn)
 
     def _toggle_mode_action(self, text):
@@ -150,9 +284,26 @@ class ClockWindow(QWidget):
         self.display_submenu.hide_menu()
         self.toggle_clock_visibility()
 
+    def _toggle_sweep_action(self, text):
+        """Toggle the sweeping second hand."""
+        self.display_submenu.hide_menu()
+        self.toggle_sweeping_hand()
+
+    def _toggle_grid_action(self, text):
+        """Toggle the multi-zone world grid."""
+        self.display_submenu.hide_menu()
+        self.toggle_world_grid()
+
+    def _toggle_timeline_action(self, text):
+        """Toggle the zone overlap timeline."""
+        self.display_submenu.hide_menu()
+        self.toggle_timeline()
+
     def toggle_timezone_menu(self):
         """Toggle continent menu visibility."""
         self.timezone_expanded = not self.timezone_expanded
+        if self.continent_container is None:
+            self.build_continent_menu()
 
         if self.timezone_expanded:
             self.continent_container.show()
@@ -164,15 +315,39 @@ class ClockWindow(QWidget):
 
     def show_audio_menu(self):
         """Show audio submenu."""
+        if self.audio_submenu is None:
+            self.audio_submenu = self.build_submenu([
+                ("Toggle Sound On/Off", self._toggle_sound_action),
+                ("Switch Sound Effect", self._switch_sound_action),
+            ])
         self.audio_submenu.show_menu(self.audio_menu_btn)
 
+    def show_alarm_menu(self):
+        """Show alarms submenu."""
+        if self.alarm_submenu is None:
+            self.alarm_submenu = self.build_submenu([
+                ("Add Alarm Here", self._add_alarm_action),
+                ("Upcoming Alarms", self._upcoming_alarms_action),
+                ("Clear Alarms", self._clear_alarms_action),
+            ])
+        self.alarm_submenu.show_menu(self.alarm_menu_btn)
+
     def show_info_menu(self):
         """Show info submenu."""
+        if self.info_submenu is None:
+            self.info_submenu = self.build_submenu([
+                ("About", self._show_about_action),
+                ("Support", self._open_support_action),
+                ("Memory Report", self._show_memory_report_action),
+            ])
         self.info_submenu.show_menu(self.info_menu_btn)
 
     def _toggle_sound_action(self, text):
         """Toggle sound and hide menu."""
-        self.audio_manager.toggle()
+        if self.audio_manager is None:
+            self.start_audio()
+        else:
+            self.audio_manager.toggle()
         self.audio_submenu.hide_menu()
 
     def _switch_sound_action(self, text):
@@ -180,6 +355,21 @@ class ClockWindow(QWidget):
         self.audio_submenu.hide_menu()
         self.switch_sound()
 
+    def _add_alarm_action(self, text):
+        """Add an alarm for the current city."""
+        self.alarm_submenu.hide_menu()
+        self.add_alarm()
+
+    def _upcoming_alarms_action(self, text):
+        """List the next alarms."""
+        self.alarm_submenu.hide_menu()
+        self.show_upcoming_alarms()
+
+    def _clear_alarms_action(self, text):
+        """Delete every alarm."""
+        self.alarm_submenu.hide_menu()
+        self.clear_alarms()
+
     def _show_about_action(self, text):
         """Show about dialog."""
         self.info_submenu.hide_menu()
@@ -190,21 +380,54 @@ class ClockWindow(QWidget):
         self.info_submenu.hide_menu()
         self.open_support()
 
+    def _show_memory_report_action(self, text):
+        """Show asset memory report."""
+        self.info_submenu.hide_menu()
+        self.show_memory_report()
+
     def setup_timer(self):
-        """Setup animation timer."""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animation_loop)
-        self.timer.start(int(1000 / ClockConfig.FPS))
+        """Follow the second-aligned tick scheduler."""
+        self.scheduler = self.services.scheduler
+        self.scheduler.tick.connect(self.animation_loop)
+        self.services.register(self)
+        self.services.request_high_rate(self, self.renderer.sweeping_seconds)
+        self.services.start()
+
+    @property
+    def audio_manager(self):
+        """The audio engine, or None until sound is first used."""
+        return self.services.audio_manager
+
+    def start_audio(self):
+        """Load the audio backend and start ticking sounds."""
+        self.services.start_audio()
+
+    def finish_startup(self):
+        """Work deferred until the first frame is on screen."""
+        if ClockConfig.SOUND_ENABLED:
+            self.start_audio()
+        startup_profiler.mark("audio")
+
+        self.services.start_alarms().fired.connect(self.show_alarm)
+        startup_profiler.mark("alarms")
+
+        self.release_snapshot()
+        self.prefetch_next_style()
+        # Build the zone search index before the menu is first opened
+        QTimer.singleShot(0, zone_catalog)
+        startup_profiler.mark("deferred startup")
+        startup_profiler.report()
 
     def toggle_clock_mode(self):
         """Toggle between digital and analog modes."""
         self.is_digital = not self.is_digital
 
         if self.is_digital:
-            self.current_style = self.digital_styles["Aqua"]
+            self.current_style_path = ClockConfig.DIGITAL_STYLES["Aqua"]
         else:
-            self.current_style = self.analog_styles["Omega"]
+            self.current_style_path = ClockConfig.ANALOG_STYLES["Omega"]
 
+        self.prefetch_next_style()
         self.update()
 
     def toggle_clock_visibility(self):
@@ -212,49 +435,139 @@ class ClockWindow(QWidget):
         self.show_clock = not self.show_clock
         self.update()
 
+    def toggle_sweeping_hand(self):
+        """Toggle between a ticking and a sweeping second hand."""
+        self.renderer.sweeping_seconds = not self.renderer.sweeping_seconds
+        self.services.request_high_rate(self, self.renderer.sweeping_seconds)
+        self.shown_second = None
+        self.animation_loop()
+
+    def toggle_world_grid(self):
+        """Show or hide the multi-zone world grid."""
+        if self.world_grid is None:
+            from clock.ui.grid import WorldGridWidget
+
+            self.world_grid = WorldGridWidget(self.scheduler, parent=self)
+            self.world_grid.setGeometry(self.grid_geometry())
+            self.sidebar.raise_()
+
+        self.world_grid.setVisible(not self.world_grid.isVisible())
+        if self.timeline is not None:
+            self.timeline.hide()
+        self.update()
+
+    def toggle_timeline(self):
+        """Show or hide the zone overlap timeline."""
+        if self.timeline is None:
+            # Imported here so NumPy is only loaded when the view is used
+            from clock.ui.timeline import ZoneTimelineWidget
+
+            self.timeline = ZoneTimelineWidget(self.scheduler, parent=self)
+            self.timeline.setGeometry(self.grid_geometry())
+            self.sidebar.raise_()
+
+        self.timeline.setVisible(not self.timeline.isVisible())
+        if self.world_grid is not None:
+            self.world_grid.hide()
+        self.update()
+
+    def grid_geometry(self):
+        """Area right of the collapsed sidebar."""
+        left = self.sidebar.collapsed_width
+        return QRect(left, 0, self.width() - left, self.height())
+
     def change_clock_style(self):
         """Change the current clock style."""
-        if self.is_digital:
-            self.current_style = get_next_style(self.current_style,
-                                                self.digital_styles)
-        else:
-            self.current_style = get_next_style(self.current_style,
-                                                self.analog_styles)
+        self.current_style_path = get_next_style(self.current_style_path,
+                                                 self.style_table())
+        self.prefetch_next_style()
         self.update()
 
-    def set_timezone(self, city):
-        tz_name = ClockConfig.TIME_ZONES.get(city)
+    @property
+    def current_style(self):
+        """Decoded pixmap of the current style."""
+        return self.assets.pixmap(self.current_style_path)
+
+    def style_table(self):
+        """Style paths for the current clock mode."""
+        if self.is_digital:
+            return ClockConfig.DIGITAL_STYLES
+        return ClockConfig.ANALOG_STYLES
+
+    def prefetch_next_style(self):
+        """Decode the style that change_clock_style will pick next."""
+        size = None if self.is_digital else self.dial_pixel_size()
+        self.assets.prefetch(get_next_style(self.current_style_path,
+                                            self.style_table()), size)
+
+    def dial_size(self):
+        """Edge length of the analog dial face in logical pixels."""
+        return int(min(self.width(), self.height()) * 0.8)
 
-        self.selected_tz = pytz.timezone(tz_name)
+    def dial_pixel_size(self):
+        """Edge length of the analog dial face in device pixels."""
+        edge = int(self.dial_size() * self.devicePixelRatioF())
+        return QSize(edge, edge)
+
+    def set_timezone(self, city, tz_name=None):
+        """Show the time of ``city``, in ``tz_name`` if it is not listed."""
+        tz_name = tz_name or ClockConfig.TIME_ZONES.get(city)
+
+        self.selected_tz = tz_name
         self.local_time = get_local_time(tz_name)
         self.current_city = city
 
         self.update_background(city)
-        self.cached_size = None
         self.update()
 
     def update_background(self, city):
-        """Update background image for the selected city."""
+        """Start loading the background image for the selected city.
+
+        Returns whether a load was started.
+        """
         try:
             image_path = ClockConfig.CITY_IMAGES.get(city)
             if image_path:
-                if os.path.exists(image_path):
-                    self.background_image = QPixmap(image_path)
-                    self.cached_size = None
-                else:
-
-                    for key, path in ClockConfig.CITY_IMAGES.items():
-                        if os.path.exists(path):
-                            self.background_image = QPixmap(path)
-                            self.cached_size = None
-                            break
-            else:
-                print(f"No background image defined for city: {city}")
+                if not asset_exists(image_path):
+                    image_path = next(
+                        (path for path in ClockConfig.CITY_IMAGES.values()
+                         if asset_exists(path)), None)
+
+                if image_path:
+                    self.loader.load(city, image_path, self.size())
+                    return True
+            # Cities without an image keep the current background
         except Exception as e:
             print(f"Error loading background image: {e}")
+        return False
+
+    def _on_background_ready(self, city, image):
+        """Swap in a decoded background, crossfading on city changes."""
+        if city != self.background_city and self.face_layer is not None:
+            self.previous_layer = self.face_layer
+            self.fade.stop()
+            self.fade.start()
+
+        self.background_image = QPixmap.fromImage(image)
+        self.background_city = city
+        self.face_layer_key = None
+        self.awaiting_background = False
+        self.release_snapshot()
+        self.update()
+
+    def _on_background_failed(self, city):
+        """Stop waiting for a background that could not be decoded."""
+        self.awaiting_background = False
+        self.release_snapshot()
+
+    def _on_fade_finished(self):
+        """Release the layer that was faded out."""
+        self.previous_layer = None
 
     def switch_sound(self):
         """Switch to next sound."""
+        if self.audio_manager is None:
+            self.start_audio()
         self.audio_manager.switch_sound()
 
     @staticmethod
@@ -278,72 +591,313 @@ class ClockWindow(QWidget):
             "Created with PyQt5"
         )
 
+    def add_alarm(self):
+        """Ask for a time and days and add an alarm in the current city."""
+        from clock.alarms import parse_alarm
+
+        text, accepted = QInputDialog.getText(
+            self, "Add Alarm",
+            f"Time in {self.current_city} and optional days\n"
+            f"(e.g. 07:30, 09:00 weekdays, 18:15 Mon,Wed,Fri):")
+        if not accepted or not text.strip():
+            return
+        try:
+            hour, minute, weekdays = parse_alarm(text)
+        except ValueError as e:
+            QMessageBox.warning(self, "Add Alarm", f"Invalid alarm: {e}")
+            return
+        self.services.start_alarms().add(self.current_city, self.selected_tz,
+                                         hour, minute, weekdays)
+
+    def show_upcoming_alarms(self):
+        """Show the next alarms with their local firing times."""
+        alarms = self.services.start_alarms().upcoming(10)
+        lines = []
+        for alarm in alarms:
+            here = get_local_time(self.selected_tz, alarm.next_fire)
+            lines.append(f"{here:%a %H:%M} here: {alarm.describe()}")
+        QMessageBox.information(self, "Upcoming Alarms",
+                                "\n".join(lines) or "No alarms set")
+
+    def clear_alarms(self):
+        """Delete every alarm after confirmation."""
+        if QMessageBox.question(self, "Clear Alarms",
+                                "Delete all alarms?") == QMessageBox.Yes:
+            self.services.start_alarms().clear()
+
+    def show_alarm(self, alarm):
+        """Announce a firing alarm without blocking the clock."""
+        box = QMessageBox(QMessageBox.Information, "Alarm", alarm.describe(),
+                          QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.setModal(False)
+        box.show()
+
+    def show_memory_report(self):
+        """Show bytes held per cached image asset."""
+        lines = [f"{name}: {size / 1024 ** 2:.1f} MB"
+                 for name, size in self.assets.memory_report()]
+        lines.append("")
+        lines.append(f"Total: {self.assets.used / 1024 ** 2:.1f} MB of "
+                     f"{self.assets.budget / 1024 ** 2:.0f} MB budget")
+        QMessageBox.information(self, "Memory Report", "\n".join(lines))
+
     def animation_loop(self):
-        """Update time and trigger repaint."""
-        self.local_time = get_local_time(self.selected_tz.zone)
-        self.update()
+        """Update time and repaint only the hands or digital text."""
+        with frame_profiler.phase("animation_loop"):
+            # The shared scheduler runs at frame rate while any window has
+            # a sweeping hand; windows that step once a second skip the
+            # ticks that fall within the second they already show
+            second = int(zone_engine.source.now())
+            animated = self.renderer.sweeping_seconds and not self.is_digital
+            if animated or second != self.shown_second:
+                self.shown_second = second
+                self.local_time = get_local_time(self.selected_tz)
+                if self.scene_view is not None:
+                    self.scene_view.set_time(self.local_time)
+                elif self.show_clock and not self.grid_visible():
+                    self.update(self.clock_rect())
+            if frame_profiler.enabled:
+                self.update(frame_profiler.hud_rect(self.width()))
+
+    def update_exposure(self):
+        """Pause when minimized, hidden or unexposed; resync when back."""
+        handle = self.windowHandle()
+        exposed = self.isVisible() and not self.isMinimized() and \
+            (handle is None or handle.isExposed())
+        if exposed == self.exposed:
+            return
+        self.exposed = exposed
+
+        self.services.set_visible(self, exposed)
+        if exposed:
+            # Ticks were skipped while hidden, maybe across a suspend; show
+            # the current second now
+            zone_engine.source.check()
+            self.shown_second = None
+            self.animation_loop()
+            self.update()
+
+    def showEvent(self, event):
+        """Watch the native window for exposure changes."""
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and handle is not self.watched_handle:
+            self.watched_handle = handle
+            handle.installEventFilter(self)
+            handle.visibilityChanged.connect(self.update_exposure)
+        self.update_exposure()
+
+    def hideEvent(self, event):
+        """Pause ticking while hidden."""
+        super().hideEvent(event)
+        self.update_exposure()
+
+    def changeEvent(self, event):
+        """Pause ticking while minimized."""
+        super().changeEvent(event)
+        if event.type() == event.WindowStateChange:
+            self.update_exposure()
+
+    def grid_visible(self):
+        """Whether the world grid or timeline currently covers the clock."""
+        return any(overlay is not None and overlay.isVisible()
+                   for overlay in (self.world_grid, self.timeline))
 
     def resizeEvent(self, event):
         """Handle window resize."""
         super().resizeEvent(event)
 
         self.sidebar.setFixedHeight(self.height())
+        if self.scene_view is not None:
+            self.scene_view.setGeometry(self.rect())
+        for overlay in (self.world_grid, self.timeline):
+            if overlay is not None:
+                overlay.setGeometry(self.grid_geometry())
 
         # Update clock dimensions
-        h_width = self.width() / 2
-        h_height = self.height() / 2
-        radius = h_height - 50
-
-        self.radius_map = {
-            "sec": radius - 100,
-            "min": radius - 150,
-            "hour": radius - 250,
-            "digit": radius - 30
-        }
+        radius_map = self.renderer.radius_map(self.height())
+        if radius_map != self.radius_map:
+            self.radius_map = radius_map
+            self.renderer.invalidate_hands()
+
+        # Rescale smoothly only once the user stops dragging
+        self.resizing = True
+        self.resize_timer.start()
+
+    def _on_resize_settled(self):
+        """Decode the background and dial for the final window size."""
+        self.resizing = False
+        if self.background_city is not None:
+            self.update_background(self.background_city)
+        self.update()
 
-        self.cached_size = None
+    def dial_pixmap(self):
+        """Dial decoded for the current size, or a stand-in while it loads.
+
+        The stand-in is the last crisp dial of the same style; the painter
+        stretches it with fast scaling, so resizing never decodes the
+        full-resolution style image on the GUI thread.
+        """
+        path = self.current_style_path
+        size = self.dial_pixel_size()
+        proxy = self.dial_proxy
+        if not self.assets.cached(path, size) and proxy is not None \
+                and proxy[0] == path:
+            if not self.resizing:
+                self.dial_loader.load(path, path, size, Qt.IgnoreAspectRatio)
+            return proxy[1]
+
+        dial = self.assets.pixmap(path, size)
+        self.dial_proxy = (path, dial)
+        return dial
+
+    def _on_dial_ready(self, path, image):
+        """Swap in a dial decoded off-thread."""
+        if path != self.current_style_path or \
+                image.size() != self.dial_pixel_size():
+            return
+        self.assets.store(path, image.size(), image)
+        self.face_layer_key = None
+        if self.scene_view is not None:
+            self.scene_view.key = None
+        self.update()
 
-    def paintEvent(self, event):
-        """Paint the clock."""
-        painter = QPainter(self)
+    def clock_rect(self):
+        """Region covered by the parts of the clock that change each tick."""
+        h_width = self.width() // 2
+        h_height = self.height() // 2
+
+        if self.is_digital:
+            return self.renderer.digital.bounds(
+                self.width(), self.height(), self.current_style,
+                self.devicePixelRatioF()
+            )
+
+        # Longest hand plus room for its outline and the centre cap
+        reach = int(max(self.radius_map.values(), default=0)) + 12
+        return QRect(h_width - reach, h_height - reach, reach * 2, reach * 2)
+
+    def face_layer_cache_key(self):
+        """Key identifying everything baked into the face layer."""
+        return (self.width(), self.height(), self.devicePixelRatioF(),
+                self.background_city, self.is_digital, self.show_clock,
+                self.current_style_path)
+
+    def build_face_layer(self):
+        """Compose the scaled background and dial face or plate."""
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(int(self.width() * ratio),
+                        int(self.height() * ratio))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(self.palette().window().color())
+
+        painter = QPainter(layer)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        # Draw background
         if self.background_image:
-            if self.cached_size != self.size():
-                self.cached_image = self.background_image.scaled(
-                    self.width(), self.height(), Qt.KeepAspectRatioByExpanding
+            with frame_profiler.phase("layer background"):
+                background = self.background_image.scaled(
+                    self.width(), self.height(),
+                    Qt.KeepAspectRatioByExpanding
                 )
-                self.cached_size = self.size()
+                painter.drawPixmap(0, 0, background)
+
+        if self.show_clock and self.current_style_path:
+            with frame_profiler.phase("layer face"):
+                if self.is_digital:
+                    self.renderer.digital.draw_plate(
+                        painter, self.width(), self.height(),
+                        self.current_style
+                    )
+                else:
+                    # Native device size once settled; while resizing a
+                    # stand-in is stretched with fast scaling
+                    size = self.dial_size()
+                    x = self.width() / 2 - size / 2
+                    y = self.height() / 2 - size / 2
+                    painter.drawPixmap(int(x), int(y), size, size,
+                                       self.dial_pixmap())
 
-            if self.cached_image:
-                painter.drawPixmap(0, 0, self.cached_image)
+        painter.end()
+        return layer
+
+    def paintEvent(self, event):
+        """Paint the clock."""
+        if self.scene_view is not None:
+            # The scene view covers the window and paints everything
+            return
+
+        with frame_profiler.phase("paint"):
+            self.paint_clock()
+        self.mark_first_frame()
+
+    def mark_first_frame(self):
+        """Schedule deferred startup work once the clock is on screen."""
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            startup_profiler.mark("first paint")
+            QTimer.singleShot(0, self.finish_startup)
+
+    def paint_clock(self):
+        """Blit the face layer and draw the parts that change each tick."""
+        if self.snapshot is not None and not self.snapshot_fits():
+            self.snapshot = None
+        key = self.face_layer_cache_key()
+        if self.face_layer_key != key and self.snapshot is None:
+            self.face_layer = self.build_face_layer()
+            self.face_layer_key = key
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Blit background and dial face; Qt clips this to the dirty region
+        with frame_profiler.phase("background blit"):
+            if self.snapshot is not None:
+                # Same aspect as the window, so scaling cannot distort it
+                painter.drawImage(self.rect(), self.snapshot)
+            elif self.previous_layer is not None:
+                painter.drawPixmap(0, 0, self.previous_layer)
+                painter.setOpacity(self.fade.currentValue())
+                painter.drawPixmap(0, 0, self.face_layer)
+                painter.setOpacity(1.0)
+            else:
+                painter.drawPixmap(0, 0, self.face_layer)
 
         # Draw clock
         if self.show_clock:
             if self.is_digital:
-                self.renderer.draw_digital_clock(
-                    painter, self.local_time, self.width(),
-                    self.height(), self.current_style
-                )
+                with frame_profiler.phase("digital text"):
+                    self.renderer.draw_digital_time(
+                        painter, self.local_time, self.width(),
+                        self.height(), self.current_style
+                    )
             else:
-                # Draw clock face image
-                if self.current_style:
-                    size = min(self.width(), self.height()) * 0.8
-                    x = self.width() / 2 - size / 2
-                    y = self.height() / 2 - size / 2
-                    painter.drawPixmap(int(x), int(y), int(size), int(size),
-                                       self.current_style)
-
-                # Draw clock face markers and hands
-                self.renderer.draw_analog_clock(
-                    painter, self.local_time, self.width(),
-                    self.height(), self.radius_map
-                )
+                with frame_profiler.phase("hands"):
+                    self.renderer.draw_analog_clock(
+                        painter, self.local_time, self.width(),
+                        self.height(), self.radius_map
+                    )
+
+        if frame_profiler.enabled:
+            frame_profiler.draw_hud(painter, self.width())
+
+    def closeEvent(self, event):
+        """Save the last frame so the next launch can show it at once."""
+        if self.use_snapshot and self.snapshot is None and \
+                self.face_layer is not None and self.scene_view is None:
+            state = self.snapshot_state()
+            state["background_city"] = self.background_city
+            frame_snapshot.save(self.face_layer, state)
+        super().closeEvent(event)
 
     def eventFilter(self, obj, event):
-        """Handle events for submenu mouse tracking."""
-        if event.type() == event.Enter:
+        """Handle events for submenu mouse tracking and window exposure."""
+        if obj is self.watched_handle:
+            if event.type() == event.Expose:
+                # Let the window record its new state before we read it
+                QTimer.singleShot(0, self.update_exposure)
+        elif event.type() == event.Enter:
             if hasattr(obj, 'parent_menu'):
                 obj.parent_menu.hide_timer.stop()
         elif event.type() == event.Leave:
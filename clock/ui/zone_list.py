@@ -0,0 +1,136 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt5.QtWidgets import QFrame, QLineEdit, QListView, QVBoxLayout
+
+from clock.catalog import zone_catalog
+
+
+class ZoneListModel(QAbstractListModel):
+    """Exposes a sequence of catalog entry indexes to a list view.
+
+    Only the rows the view actually displays are ever looked up, so the
+    cost of showing the list does not depend on how many zones it holds.
+    """
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.rows = range(0)
+
+    def set_rows(self, rows):
+        """Replace the displayed entries."""
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.catalog.entries[self.rows[index.row()]]
+        if role == Qt.DisplayRole:
+            return entry.label
+        if role == Qt.ToolTipRole:
+            return entry.tz_name
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+
+class ZoneListPopup(QFrame):
+    """Searchable, virtualized list of zones shown next to a menu item."""
+
+    zone_selected = pyqtSignal(str, str)
+
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.Popup)
+        self.setFixedSize(320, 420)
+
+        self.catalog = zone_catalog()
+        self.base_rows = rows if rows is not None else range(
+            len(self.catalog))
+
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search cities or countries…")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(self._on_search)
+
+        self.model = ZoneListModel(self.catalog, self)
+        self.model.set_rows(self.base_rows)
+
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setEditTriggers(QListView.NoEditTriggers)
+        self.view.clicked.connect(self._on_activated)
+        self.view.activated.connect(self._on_activated)
+        self.search_box.returnPressed.connect(self._on_return)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(6)
+        layout.addWidget(self.search_box)
+        layout.addWidget(self.view)
+
+        self.setStyleSheet("""
+            ZoneListPopup {
+                background-color: rgba(40, 40, 40, 240);
+                border: 1px solid rgba(100, 149, 237, 180);
+                border-radius: 8px;
+            }
+            QLineEdit {
+                background-color: rgba(30, 30, 30, 210);
+                color: white;
+                border: 1px solid rgba(100, 149, 237, 120);
+                border-radius: 6px;
+                padding: 6px 8px;
+            }
+            QListView {
+                background-color: rgba(30, 30, 30, 210);
+                color: white;
+                border: none;
+                border-radius: 6px;
+            }
+            QListView::item {
+                padding: 6px 4px;
+            }
+            QListView::item:hover, QListView::item:selected {
+                background-color: rgba(100, 149, 237, 150);
+            }
+        """)
+
+    def _on_search(self, text):
+        """Show search results, or the base list for an empty query."""
+        self.model.set_rows(self.catalog.search(text) if text.strip()
+                            else self.base_rows)
+        if self.model.rowCount():
+            self.view.setCurrentIndex(self.model.index(0))
+
+    def _on_return(self):
+        """Pick the highlighted entry."""
+        index = self.view.currentIndex()
+        if index.isValid():
+            self._on_activated(index)
+
+    def _on_activated(self, index):
+        """Emit the chosen city and zone, then close."""
+        entry = self.model.data(index, Qt.UserRole)
+        self.hide_menu()
+        self.zone_selected.emit(entry.city, entry.tz_name)
+
+    def show_menu(self, parent_widget):
+        """Show the list to the right of the parent widget."""
+        if not parent_widget:
+            return
+
+        global_pos = parent_widget.mapToGlobal(parent_widget.rect().topRight())
+        self.move(global_pos.x() + 5, global_pos.y())
+        self.show()
+        self.search_box.setFocus()
+
+    def hide_menu(self):
+        """Hide the list and reset the search."""
+        self.hide()
+        self.search_box.clear()
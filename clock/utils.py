@@ -1,6 +1,7 @@
 import math
-import pytz
-from datetime import datetime
+from datetime import datetime, timezone
+
+from clock.zones import zone_engine
 
 
 def deg_to_rad(degrees):
@@ -23,7 +24,14 @@ def get_next_style(current_style, style_dict):
     return current_style
 
 
-def get_local_time(tz_name):
-    """Get current time in a specific timezone."""
-    tz = pytz.timezone(tz_name)
-    return datetime.now().astimezone(tz)
+def get_local_time(tz_name, utc_ts=None):
+    """Get the current (or ``utc_ts``) time in a specific timezone."""
+    return zone_engine.local_time(tz_name, utc_ts)
+
+
+def get_next_transition(tz_name):
+    """Get the UTC datetime of the zone's next offset change, or None."""
+    moment = zone_engine.next_transition(tz_name)
+    if moment is None:
+        return None
+    return datetime.fromtimestamp(moment, timezone.utc)
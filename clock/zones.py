@@ -0,0 +1,103 @@
+from bisect import bisect_right
+from calendar import timegm
+from datetime import datetime, timedelta, timezone
+
+import pytz
+
+from clock.timesource import TimeSource
+
+
+class ZoneTable:
+    """UTC-offset transition table for a single time zone."""
+
+    def __init__(self, tz_name):
+        tz = pytz.timezone(tz_name)
+        self.name = tz_name
+
+        transitions = getattr(tz, "_utc_transition_times", None)
+        if transitions:
+            # The first entry is datetime.min, which timegm cannot map
+            self.starts = [float("-inf")] + [
+                timegm(moment.timetuple()) for moment in transitions[1:]
+            ]
+            infos = tz._transition_info
+        else:
+            # Fixed-offset zones such as UTC or Etc/GMT+5
+            local = datetime.now(pytz.utc).astimezone(tz)
+            self.starts = [float("-inf")]
+            infos = [(local.utcoffset(), None, local.tzname())]
+
+        self.offsets = [int(info[0].total_seconds()) for info in infos]
+        self.tzinfos = [
+            timezone(timedelta(seconds=offset), abbreviation)
+            for offset, (_, _, abbreviation) in zip(self.offsets, infos)
+        ]
+
+    def index_at(self, utc_ts):
+        """Index of the transition in effect at ``utc_ts``."""
+        return bisect_right(self.starts, utc_ts) - 1
+
+    def span(self, index):
+        """Return (start, end) epoch seconds of the given entry."""
+        start = self.starts[index]
+        end = (self.starts[index + 1] if index + 1 < len(self.starts)
+               else float("inf"))
+        return start, end
+
+
+class ZoneEngine:
+    """Caches zone transition tables and the offset currently in effect.
+
+    A new bisect only happens once the cached entry's next transition has
+    passed, so converting "now" is a single UTC read plus an offset add.
+    "Now" comes from ``source``, which can be replaced with a
+    ``FakeTimeSource`` to replay any moment at any speed.
+    """
+
+    def __init__(self, source=None):
+        self.tables = {}
+        self.current = {}
+        self.source = source or TimeSource()
+
+    def table(self, tz_name):
+        """Return the (cached) transition table for a zone."""
+        table = self.tables.get(tz_name)
+        if table is None:
+            table = self.tables[tz_name] = ZoneTable(tz_name)
+        return table
+
+    def entry(self, tz_name, utc_ts):
+        """Return (start, end, offset, tzinfo) in effect at ``utc_ts``."""
+        cached = self.current.get(tz_name)
+        if cached and cached[0] <= utc_ts < cached[1]:
+            return cached
+
+        table = self.table(tz_name)
+        index = table.index_at(utc_ts)
+        start, end = table.span(index)
+        cached = (start, end, table.offsets[index], table.tzinfos[index])
+        self.current[tz_name] = cached
+        return cached
+
+    def utc_offset(self, tz_name, utc_ts=None):
+        """UTC offset in seconds for a zone."""
+        if utc_ts is None:
+            utc_ts = self.source.now()
+        return self.entry(tz_name, utc_ts)[2]
+
+    def local_time(self, tz_name, utc_ts=None):
+        """Aware local datetime for a zone."""
+        if utc_ts is None:
+            utc_ts = self.source.now()
+        tzinfo = self.entry(tz_name, utc_ts)[3]
+        return datetime.fromtimestamp(utc_ts, tzinfo)
+
+    def next_transition(self, tz_name, utc_ts=None):
+        """Epoch seconds of the next offset change, or None."""
+        if utc_ts is None:
+            utc_ts = self.source.now()
+        end = self.entry(tz_name, utc_ts)[1]
+        return None if end == float("inf") else end
+
+
+zone_engine = ZoneEngine()
@@ -1,13 +1,50 @@
+import argparse
+
+# Imported before the Qt-heavy modules below so their import time counts
+# towards the first startup phase
+from clock.startup import startup_profiler
+from clock.instrument import frame_profiler
 from clock.ui.window import ClockWindow
 from PyQt5.QtWidgets import QApplication
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Global Clock")
+    parser.add_argument("--profile", action="store_true",
+                        help="show frame timings in an overlay")
+    parser.add_argument("--profile-export", metavar="PATH",
+                        help="write frame timings on exit (.json trace "
+                             "or .csv)")
+    parser.add_argument("--backend", choices=("painter", "scene"),
+                        help="rendering backend (default from ClockConfig)")
+    parser.add_argument("--signage", action="store_true",
+                        help="open a full-screen clock on every screen")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print how long each startup phase takes")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    startup_profiler.mark("imports")
+    args = parse_args()
+    startup_profiler.enabled = args.startup_profile
+    if args.profile or args.profile_export:
+        frame_profiler.enabled = True
+    if args.profile_export:
+        frame_profiler.export_path = args.profile_export
 
     try:
         app = QApplication([])
-        window = ClockWindow()
-        window.show()
+        startup_profiler.mark("QApplication")
+        if args.signage:
+            from clock.ui.signage import open_signage_windows
+            windows = open_signage_windows(backend=args.backend)
+        else:
+            window = ClockWindow(backend=args.backend)
+            window.show()
+        startup_profiler.mark("window")
         app.exec()
     except Exception as error:
         print(f"Application error: {error}")
+    finally:
+        frame_profiler.export()